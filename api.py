@@ -1,13 +1,23 @@
-from fastapi import FastAPI, HTTPException, Query, Form
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
 from typing import List, Optional
 import os
-import json
-import uuid
+import re
+import hashlib
+import secrets
+import shutil
 import tempfile
+import threading
+import traceback
+from contextlib import asynccontextmanager
+import asyncio
+import orjson
+import httpx
+from cachetools import TTLCache
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,18 +26,23 @@ load_dotenv()
 
 # Import functions from generate.py
 from generate import (
-    fetch_job_offer,
+    parse_job_offer,
+    load_cached_offer,
+    save_cached_offer,
     adapt_profile,
     generate_cv,
     generate_cover_letter,
     compile_latex,
     translate_profile_to_english,
     load_profile as load_profile_from_file,
-    generate_cover_with_mistral
+    generate_cover_with_mistral,
+    get_mistral_client,
+    PROFILE_PATH,
+    FETCH_HEADERS
 )
 
 # Supabase setup
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
@@ -36,10 +51,35 @@ if not SUPABASE_URL or not SUPABASE_KEY or SUPABASE_URL == "your_supabase_projec
     print("⚠️  Supabase non configuré - Mode fichiers locaux activé")
     supabase = None
 else:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    # Pooled HTTP/2 client so every Supabase call reuses warm TLS connections
+    supabase_http = httpx.Client(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+    )
+    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(httpx_client=supabase_http))
+    # Async client for Storage uploads made from the event loop
+    storage_http = httpx.AsyncClient(
+        base_url=f"{SUPABASE_URL}/storage/v1",
+        headers={"apikey": SUPABASE_KEY, "Authorization": f"Bearer {SUPABASE_KEY}"},
+        http2=True,
+        timeout=30
+    )
     print("✅ Supabase connecté")
 
-app = FastAPI(title="CVTeX API", version="2.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the LaTeX toolchain in the background so startup isn't delayed
+    warm_up = asyncio.create_task(warm_up_latex())
+    yield
+    warm_up.cancel()
+    # Scratch directories live in RAM-backed tmpfs, don't leave them behind
+    for work_dir in _WORK_DIR_PATHS:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    # The PDF cache only lives as long as the process
+    shutil.rmtree(PDF_CACHE_DIR, ignore_errors=True)
+
+app = FastAPI(title="CVTeX API", version="2.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS for frontend
 app.add_middleware(
@@ -56,29 +96,134 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shared keep-alive HTTP/2 client for scraping job offers
+scraper_http = httpx.AsyncClient(
+    http2=True,
+    timeout=15,
+    follow_redirects=True,
+    headers=FETCH_HEADERS,
+    limits=httpx.Limits(max_keepalive_connections=32)
+)
+
+async def fetch_job_offer_async(url: str) -> dict:
+    """Fetch a job offer on the event loop, then parse it in a worker thread"""
+    # Offers analyzed less than an hour ago are served from the disk cache
+    cached = await asyncio.to_thread(load_cached_offer, url)
+    if cached:
+        return cached
+    
+    try:
+        response = await scraper_http.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=400, detail=f"Could not fetch job offer: {e}")
+    # Raw bytes, parse_job_offer reads them as UTF-8 without charset guessing
+    job_data = await asyncio.to_thread(parse_job_offer, url, response.content)
+    await asyncio.to_thread(save_cached_offer, url, job_data)
+    return job_data
+
 # Local fallback storage
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
-APPLICATIONS_FILE = DATA_DIR / "applications.json"
+APPLICATIONS_FILE = DATA_DIR / "applications.jsonl"
+LEGACY_APPLICATIONS_FILE = DATA_DIR / "applications.json"
 OUTPUT_DIR = Path("output")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Compact the log once this fraction of its lines are updates/tombstones
+COMPACTION_RATIO = 0.3
+
 # ============= Storage Functions =============
 
+# In-memory index of the local applications log, keyed by id (oldest first)
+_APPS_CACHE: dict = {}
+_APPS_LOG_LINES = 0
+_APPS_LOCK = threading.Lock()
+
+def _replay_applications_log():
+    """Rebuild the in-memory index from the append-only JSONL log"""
+    global _APPS_LOG_LINES
+    if not APPLICATIONS_FILE.exists():
+        # Migrate the previous single-document storage format
+        if LEGACY_APPLICATIONS_FILE.exists():
+            with open(LEGACY_APPLICATIONS_FILE, 'rb') as f:
+                save_applications_local(orjson.loads(f.read()))
+        return
+    
+    with open(APPLICATIONS_FILE, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            _APPS_LOG_LINES += 1
+            op = record.get("__op")
+            if op == "update":
+                if record["id"] in _APPS_CACHE:
+                    _APPS_CACHE[record["id"]].update(record["patch"])
+            elif op == "delete":
+                _APPS_CACHE.pop(record["id"], None)
+            else:
+                _APPS_CACHE.pop(record["id"], None)
+                _APPS_CACHE[record["id"]] = record
+
+def _append_applications_log(record: dict):
+    """Append one record to the log and compact it if it holds too much garbage"""
+    global _APPS_LOG_LINES
+    with open(APPLICATIONS_FILE, 'ab') as f:
+        f.write(orjson.dumps(record, default=str) + b"\n")
+    _APPS_LOG_LINES += 1
+    
+    stale = _APPS_LOG_LINES - len(_APPS_CACHE)
+    if stale > COMPACTION_RATIO * _APPS_LOG_LINES:
+        save_applications_local(load_applications_local())
+
 def load_applications_local():
-    if APPLICATIONS_FILE.exists():
-        with open(APPLICATIONS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+    """Return local applications, newest first"""
+    return list(reversed(_APPS_CACHE.values()))
 
 def save_applications_local(applications):
-    with open(APPLICATIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(applications, f, ensure_ascii=False, indent=2)
+    """Rewrite the log as a compact snapshot of the given applications (newest first)"""
+    global _APPS_LOG_LINES
+    tmp_file = APPLICATIONS_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp_file, 'wb') as f:
+        for app in reversed(applications):
+            f.write(orjson.dumps(app, default=str) + b"\n")
+    os.replace(tmp_file, APPLICATIONS_FILE)
+    
+    _APPS_CACHE.clear()
+    for app in reversed(applications):
+        _APPS_CACHE[app["id"]] = app
+    _APPS_LOG_LINES = len(_APPS_CACHE)
+
+_replay_applications_log()
+
+# Short-lived caches for lookups by id on the hot path
+_APP_BY_ID_CACHE = TTLCache(maxsize=1024, ttl=60)
+_TEMP_ANALYSIS_CACHE = TTLCache(maxsize=1024, ttl=60)
+# Full list served by /api/applications, cleared on every write
+_APPS_LIST_CACHE = TTLCache(maxsize=1, ttl=30)
+_LOOKUP_CACHE_LOCK = threading.Lock()
+
+def _invalidate_lookup(cache: TTLCache, key: str):
+    with _LOOKUP_CACHE_LOCK:
+        cache.pop(key, None)
+
+def _invalidate_application(app_id: str):
+    with _LOOKUP_CACHE_LOCK:
+        _APP_BY_ID_CACHE.pop(app_id, None)
+        _APPS_LIST_CACHE.clear()
 
 def get_applications():
     """Get all applications from Supabase or local file"""
     if supabase:
+        with _LOOKUP_CACHE_LOCK:
+            cached = _APPS_LIST_CACHE.get("all")
+        if cached is not None:
+            return cached
+        
         result = supabase.table("applications").select("*").order("created_at", desc=True).execute()
+        with _LOOKUP_CACHE_LOCK:
+            _APPS_LIST_CACHE["all"] = result.data
         return result.data
     return load_applications_local()
 
@@ -86,55 +231,61 @@ def save_application(application: dict):
     """Save an application to Supabase or local file"""
     if supabase:
         # Map camelCase to snake_case for Supabase
-        db_record = {
-            "id": application["id"],
-            "company": application["company"],
-            "position": application["position"],
-            "location": application.get("location"),
-            "salary": application.get("salary"),
-            "contract_type": application.get("type"),
-            "status": application.get("status", "submitted"),
-            "match_score": application.get("matchScore"),
-            "description": application.get("description"),
-            "url": application.get("url"),
-            "cv_path": application.get("cvPath"),
-            "cover_path": application.get("coverPath"),
-            "logo_url": application.get("logoUrl"),
-            "language": application.get("language", "fr"),
-            "cv_data": application.get("cvData"),
-            "cover_data": application.get("coverData")
-        }
+        db_record = ApplicationDB.model_validate(application).model_dump()
         supabase.table("applications").insert(db_record).execute()
+        _invalidate_application(application["id"])
     else:
-        applications = load_applications_local()
-        applications.insert(0, application)
-        save_applications_local(applications)
+        with _APPS_LOCK:
+            _APPS_CACHE.pop(application["id"], None)
+            _APPS_CACHE[application["id"]] = application
+            _append_applications_log(application)
 
 def update_application(app_id: str, updates: dict):
     """Update an existing application"""
     if supabase:
         supabase.table("applications").update(updates).eq("id", app_id).execute()
+        _invalidate_application(app_id)
     else:
-        applications = load_applications_local()
-        for app in applications:
-            if app["id"] == app_id:
-                app.update(updates)
-                break
-        save_applications_local(applications)
+        with _APPS_LOCK:
+            if app_id in _APPS_CACHE:
+                _APPS_CACHE[app_id].update(updates)
+                _append_applications_log({"__op": "update", "id": app_id, "patch": updates})
+
+def remove_application(app_id: str):
+    """Delete an application record"""
+    if supabase:
+        supabase.table("applications").delete().eq("id", app_id).execute()
+        _invalidate_application(app_id)
+    else:
+        with _APPS_LOCK:
+            if _APPS_CACHE.pop(app_id, None) is not None:
+                _append_applications_log({"__op": "delete", "id": app_id})
+
+def remove_application_pdfs(app_id: str):
+    """Delete the PDFs of an application from Supabase Storage"""
+    if supabase:
+        try:
+            supabase.storage.from_("documents").remove([f"cv_{app_id}.pdf", f"cover_{app_id}.pdf"])
+        except Exception as e:
+            # A leftover PDF shouldn't fail the delete
+            print(f"⚠️  Could not delete PDFs for {app_id}: {e}")
 
 def get_application_by_id(app_id: str) -> dict:
     """Get a single application by ID"""
     if supabase:
+        with _LOOKUP_CACHE_LOCK:
+            cached = _APP_BY_ID_CACHE.get(app_id)
+        if cached is not None:
+            return cached
+        
         result = supabase.table("applications").select("*").eq("id", app_id).execute()
         if result.data:
+            with _LOOKUP_CACHE_LOCK:
+                _APP_BY_ID_CACHE[app_id] = result.data[0]
             return result.data[0]
         return None
     else:
-        applications = load_applications_local()
-        for app in applications:
-            if app["id"] == app_id:
-                return app
-        return None
+        return _APPS_CACHE.get(app_id)
 
 def save_temp_analysis(temp_data: dict):
     """Save temporary analysis data"""
@@ -151,25 +302,42 @@ def save_temp_analysis(temp_data: dict):
         supabase.table("temp_analysis").insert(db_record).execute()
     else:
         temp_file = DATA_DIR / f"temp_{temp_data['id']}.json"
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(temp_data, f, ensure_ascii=False, indent=2)
+        # Write then swap atomically so readers never see a half-written file
+        tmp_file = temp_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(temp_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_file, temp_file)
+    
+    # The next preview/generate request for this id can skip the round-trip
+    with _LOOKUP_CACHE_LOCK:
+        _TEMP_ANALYSIS_CACHE[temp_data["id"]] = temp_data
 
 def get_temp_analysis(app_id: str) -> dict:
     """Get temporary analysis data"""
+    with _LOOKUP_CACHE_LOCK:
+        cached = _TEMP_ANALYSIS_CACHE.get(app_id)
+    if cached is not None:
+        return cached
+    
+    temp_data = None
     if supabase:
         result = supabase.table("temp_analysis").select("*").eq("id", app_id).execute()
         if result.data:
-            return result.data[0]
-        return None
+            temp_data = result.data[0]
     else:
         temp_file = DATA_DIR / f"temp_{app_id}.json"
         if temp_file.exists():
-            with open(temp_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
+            with open(temp_file, 'rb') as f:
+                temp_data = orjson.loads(f.read())
+    
+    if temp_data is not None:
+        with _LOOKUP_CACHE_LOCK:
+            _TEMP_ANALYSIS_CACHE[app_id] = temp_data
+    return temp_data
 
 def delete_temp_analysis(app_id: str):
     """Delete temporary analysis data"""
+    _invalidate_lookup(_TEMP_ANALYSIS_CACHE, app_id)
     if supabase:
         supabase.table("temp_analysis").delete().eq("id", app_id).execute()
     else:
@@ -177,46 +345,169 @@ def delete_temp_analysis(app_id: str):
         if temp_file.exists():
             temp_file.unlink()
 
-def upload_pdf(file_path: Path, storage_name: str) -> str:
-    """Upload PDF to Supabase Storage and return public URL"""
-    if supabase:
-        with open(file_path, 'rb') as f:
-            pdf_content = f.read()
-        
-        # Delete existing file first (for regeneration)
+def save_pdf_local(file_path: Path, storage_name: str) -> str:
+    """Copy PDF to the local output dir and return its download path"""
+    dest = OUTPUT_DIR / storage_name
+    shutil.copy(file_path, dest)
+    return f"/api/download/{storage_name}"
+
+def public_pdf_url(storage_name: str) -> str:
+    """Public URL of a PDF in the documents bucket"""
+    return f"{SUPABASE_URL}/storage/v1/object/public/documents/{storage_name}"
+
+async def read_pdf_chunks(file_path: Path, chunk_size: int = 64 * 1024):
+    """Read a file in chunks without blocking the event loop"""
+    with open(file_path, 'rb') as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+async def upload_pdf_async(file_path: Path, storage_name: str) -> str:
+    """Upload PDF to Supabase Storage (or copy it locally) and return its URL"""
+    if not supabase:
+        return await asyncio.to_thread(save_pdf_local, file_path, storage_name)
+    
+    # Streamed from disk, upsert replaces the existing file (regeneration) in a single request
+    response = await storage_http.post(
+        f"/object/documents/{storage_name}",
+        content=read_pdf_chunks(file_path),
+        headers={
+            "content-type": "application/pdf",
+            "content-length": str(file_path.stat().st_size),
+            "x-upsert": "true"
+        }
+    )
+    response.raise_for_status()
+    
+    return public_pdf_url(storage_name)
+
+def get_pdf_path(storage_name: str) -> Optional[Path]:
+    """Get the path of a PDF stored locally"""
+    file_path = OUTPUT_DIR / storage_name
+    if file_path.is_file():
+        return file_path
+    return None
+
+# ============= Profile Cache =============
+
+# language -> (profile.json mtime, profile)
+_PROFILE_CACHE: dict = {}
+
+def profile_skills(profile: dict) -> frozenset:
+    """Lowercased skill items of the profile"""
+    return frozenset(item.lower() for group in profile.get("skills", {}).values() for item in group.get("items", []))
+
+@lru_cache(maxsize=4)
+def skills_pattern(skills: frozenset) -> re.Pattern:
+    """Regex used by the match score in /api/analyze (kept out of the profile, which is served as JSON)"""
+    # Longest first so overlapping skills match the most specific one
+    alternation = "|".join(re.escape(skill) for skill in sorted(skills, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternation or '(?!)'})(?!\w)")
+
+def load_profile(language: str = "fr") -> dict:
+    """Load the profile (translated if English), cached until profile.json changes"""
+    mtime = os.stat(PROFILE_PATH).st_mtime
+    cached = _PROFILE_CACHE.get(language)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    profile = load_profile_from_file()
+    if language == "en":
+        translated = translate_profile_to_english(profile)
+        # Don't cache a failed translation, retry on the next request
+        if translated is profile:
+            return profile
+        profile = translated
+    
+    _PROFILE_CACHE[language] = (mtime, profile)
+    return profile
+
+# ============= LaTeX Work Directories =============
+
+# RAM-backed when available: LaTeX writes and rereads many small aux files
+TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Reused scratch directories, so LaTeX caches left in them survive across requests
+_WORK_DIR_PATHS = [Path(tempfile.mkdtemp(prefix="cvtex-work-", dir=TMPFS_DIR)) for _ in range(os.cpu_count() or 2)]
+_WORK_DIRS: asyncio.Queue = asyncio.Queue()
+for _work_dir in _WORK_DIR_PATHS:
+    _WORK_DIRS.put_nowait(_work_dir)
+
+@asynccontextmanager
+async def borrow_work_dir(doc_id: str):
+    """Borrow a scratch directory and remove the document's files when done"""
+    work_dir = await _WORK_DIRS.get()
+    try:
+        yield work_dir
+    finally:
+        for path in [*work_dir.glob(f"*_{doc_id}.*"), *work_dir.glob("logo.*")]:
+            path.unlink(missing_ok=True)
+        _WORK_DIRS.put_nowait(work_dir)
+
+# Compiled PDFs keyed by a hash of their LaTeX source, for the lifetime of the process
+PDF_CACHE_DIR = Path(tempfile.mkdtemp(prefix="cvtex-pdf-cache-"))
+PDF_CACHE_MAX_FILES = 256
+
+def compile_latex_cached(tex_path: Path) -> bool:
+    """Compile a .tex to PDF, reusing the PDF of an identical source"""
+    tex_source = tex_path.read_bytes()
+    # The work directory varies between requests, only the content matters
+    digest = hashlib.blake2b(tex_source.replace(str(tex_path.parent).encode(), b""), digest_size=16)
+    for logo in sorted(tex_path.parent.glob("logo.*")):
+        if str(logo).encode() in tex_source:
+            digest.update(logo.read_bytes())
+    
+    cached_pdf = PDF_CACHE_DIR / f"{digest.hexdigest()}.pdf"
+    pdf_path = tex_path.with_suffix(".pdf")
+    try:
+        shutil.copyfile(cached_pdf, pdf_path)
+        return True
+    except FileNotFoundError:
+        pass
+    
+    if not compile_latex(tex_path):
+        return False
+    
+    tmp_pdf = cached_pdf.with_suffix(f".{secrets.token_hex(4)}.tmp")
+    shutil.copyfile(pdf_path, tmp_pdf)
+    os.replace(tmp_pdf, cached_pdf)
+    
+    # Evict the oldest entries past the limit (another thread may be evicting too)
+    cached = list(PDF_CACHE_DIR.glob("*.pdf"))
+    if len(cached) > PDF_CACHE_MAX_FILES:
         try:
-            supabase.storage.from_("documents").remove([storage_name])
-        except:
-            pass  # File might not exist, that's OK
-        
-        # Upload to Supabase Storage
-        result = supabase.storage.from_("documents").upload(
-            storage_name,
-            pdf_content,
-            {"content-type": "application/pdf"}
-        )
-        
-        # Get public URL
-        public_url = supabase.storage.from_("documents").get_public_url(storage_name)
-        return public_url
-    else:
-        # Local: copy to output dir and return local path
-        import shutil
-        dest = OUTPUT_DIR / storage_name
-        shutil.copy(file_path, dest)
-        return f"/api/download/{storage_name}"
-
-def get_pdf_content(storage_name: str) -> bytes:
-    """Get PDF content from Supabase Storage or local file"""
-    if supabase:
-        result = supabase.storage.from_("documents").download(storage_name)
-        return result
-    else:
-        file_path = OUTPUT_DIR / storage_name
-        if file_path.exists():
-            with open(file_path, 'rb') as f:
-                return f.read()
-        return None
+            cached.sort(key=lambda path: path.stat().st_mtime)
+        except FileNotFoundError:
+            return True
+        for path in cached[:-PDF_CACHE_MAX_FILES]:
+            path.unlink(missing_ok=True)
+    return True
+
+def build_cv(adapted: dict, tex_path: Path) -> bool:
+    """Generate the CV .tex and compile it to PDF"""
+    generate_cv(adapted, tex_path)
+    return compile_latex_cached(tex_path)
+
+def build_cover_letter(adapted: dict, tex_path: Path, profile: dict) -> bool:
+    """Generate the cover letter .tex and compile it to PDF"""
+    generate_cover_letter(adapted, tex_path, profile=profile)
+    return compile_latex_cached(tex_path)
+
+WARM_UP_JOB = {"title": "", "company": "", "url": "", "keywords": [], "raw_text": "", "language": "fr"}
+
+async def warm_up_latex():
+    """Compile both templates once so the first request doesn't pay the cold start
+    (format loading, font maps, tectonic bundle download)"""
+    try:
+        profile = await asyncio.to_thread(load_profile)
+        adapted = adapt_profile(profile, WARM_UP_JOB)
+        async with borrow_work_dir("warmup") as tmp_path:
+            # No profile for the cover letter: skips the Mistral call
+            await asyncio.gather(
+                asyncio.to_thread(build_cv, adapted, tmp_path / "cv_warmup.tex"),
+                asyncio.to_thread(build_cover_letter, adapted, tmp_path / "cover_warmup.tex", None)
+            )
+    except Exception as e:
+        print(f"⚠️  LaTeX warm-up failed: {e}")
 
 # ============= API Models =============
 
@@ -256,10 +547,91 @@ class FinalizeRequest(BaseModel):
     cv: CVData
     coverLetter: CoverLetterData
 
+class ApplicationRecord(BaseModel):
+    """Application fields, snake_case in Supabase and camelCase (aliases) for the frontend"""
+    model_config = ConfigDict(populate_by_name=True)
+    
+    id: str
+    company: str
+    position: str
+    location: Optional[str] = None
+    salary: Optional[str] = None
+    contract_type: Optional[str] = Field(default=None, alias="type")
+    status: Optional[str] = "submitted"
+    match_score: Optional[int] = Field(default=None, alias="matchScore")
+    description: Optional[str] = None
+    url: Optional[str] = None
+    cv_path: Optional[str] = Field(default=None, alias="cvPath")
+    cover_path: Optional[str] = Field(default=None, alias="coverPath")
+    logo_url: Optional[str] = Field(default=None, alias="logoUrl")
+    language: Optional[str] = "fr"
+
+class ApplicationDB(ApplicationRecord):
+    """Application row inserted into Supabase"""
+    cv_data: Optional[dict] = Field(default=None, alias="cvData")
+    cover_data: Optional[dict] = Field(default=None, alias="coverData")
+
+class ApplicationOut(ApplicationRecord):
+    """Application row returned by the list endpoint"""
+    created_at: Optional[str] = Field(default=None, exclude=True)
+    
+    @computed_field(alias="appliedDate")
+    @property
+    def applied_date(self) -> str:
+        return self.created_at[:10] if self.created_at else ""
+
+_APPS_ADAPTER = TypeAdapter(List[ApplicationOut])
+
+# ============= Default Content =============
+
+# Fallback cover letter for /api/preview when Mistral is unavailable
+DEFAULT_PREVIEW_COVER_LETTER = {
+    "accroche": "Fort de mon expérience en data engineering et développement, je suis particulièrement intéressé par le poste de {position} chez {company}.",
+    "entreprise": "{company} est reconnue pour son expertise et son innovation. Votre vision et vos projets correspondent parfaitement à mes aspirations professionnelles.",
+    "moi": "Mon parcours m'a permis de développer des compétences solides en conception de pipelines de données, orchestration et déploiement cloud. J'ai notamment travaillé sur des projets d'envergure impliquant le traitement de données massives.",
+    "nous": "Ensemble, nous pourrions relever les défis de modernisation de vos infrastructures data et contribuer à la création de valeur à partir de vos données.",
+    "conclusion": "Je serais ravi d'échanger avec vous lors d'un entretien pour discuter de cette opportunité. Dans l'attente de votre retour, je vous prie d'agréer mes salutations distinguées."
+}
+
+# Fallback cover letter for applications saved without editable data
+DEFAULT_EDIT_COVER_LETTER = {
+    "accroche": "Fort de mon expérience, je suis particulièrement intéressé par le poste de {position} chez {company}.",
+    "entreprise": "{company} est reconnue pour son expertise et son innovation.",
+    "moi": "Mon parcours m'a permis de développer des compétences solides en conception et développement.",
+    "nous": "Ensemble, nous pourrions relever les défis techniques et contribuer à la création de valeur.",
+    "conclusion": "Je serais ravi d'échanger avec vous lors d'un entretien. Dans l'attente de votre retour, je vous prie d'agréer mes salutations distinguées."
+}
+
+DEFAULT_PREVIEW_PROJECTS = (
+    {
+        "name": "DataFlow Pipeline",
+        "description": "Pipeline de données temps réel avec Apache Kafka et Spark pour le traitement de millions d'événements par jour",
+        "technologies": "Python, Kafka, Spark, Docker, AWS"
+    },
+    {
+        "name": "ML Model Serving Platform",
+        "description": "Plateforme de déploiement de modèles ML avec API REST, monitoring et auto-scaling",
+        "technologies": "FastAPI, MLflow, Kubernetes, PostgreSQL"
+    }
+)
+
+DEFAULT_EDIT_PROJECTS = (
+    {
+        "name": "DataFlow Pipeline",
+        "description": "Pipeline de données temps réel avec Apache Kafka et Spark",
+        "technologies": "Python, Kafka, Spark, Docker, AWS"
+    },
+    {
+        "name": "ML Model Serving Platform",
+        "description": "Plateforme de déploiement de modèles ML avec API REST",
+        "technologies": "FastAPI, MLflow, Kubernetes, PostgreSQL"
+    }
+)
+
 # ============= API Endpoints =============
 
 @app.get("/api/health")
-def health_check():
+async def health_check():
     return {
         "status": "ok",
         "storage": "supabase" if supabase else "local",
@@ -267,67 +639,47 @@ def health_check():
     }
 
 @app.get("/api/applications")
-def list_applications():
+async def list_applications():
     """Get all applications"""
-    apps = get_applications()
+    apps = await asyncio.to_thread(get_applications)
     
     # Convert snake_case to camelCase for frontend compatibility
-    # Also convert storage URLs to backend download URLs for reliable access
-    def get_download_path(path):
-        """Extract filename from storage URL or return as-is"""
-        if path and 'supabase.co' in path:
-            # Extract just the filename from the full URL
-            filename = path.split('/')[-1]
-            return f"/api/download/{filename}"
-        return path
-    
+    # Storage URLs are returned as-is so PDFs are fetched straight from Supabase
     if supabase:
-        return [{
-            "id": app["id"],
-            "company": app["company"],
-            "position": app["position"],
-            "location": app.get("location"),
-            "salary": app.get("salary"),
-            "type": app.get("contract_type"),
-            "status": app.get("status", "submitted"),
-            "appliedDate": app.get("created_at", "")[:10] if app.get("created_at") else "",
-            "matchScore": app.get("match_score"),
-            "description": app.get("description"),
-            "url": app.get("url"),
-            "cvPath": get_download_path(app.get("cv_path")),
-            "coverPath": get_download_path(app.get("cover_path")),
-            "logoUrl": app.get("logo_url"),
-            "language": app.get("language", "fr")
-        } for app in apps]
+        # Serialized straight to JSON bytes by pydantic-core
+        content = _APPS_ADAPTER.dump_json(_APPS_ADAPTER.validate_python(apps), by_alias=True)
+        return Response(content=content, media_type="application/json")
     
-    return apps
+    # Return the response directly to skip jsonable_encoder on large lists
+    return ORJSONResponse(content=apps)
 
 @app.post("/api/analyze")
-def analyze_job(request: JobUrlRequest):
+async def analyze_job(request: JobUrlRequest):
     """Analyze a job offer URL"""
     try:
-        # Fetch the job offer using generate.py function
-        job_data = fetch_job_offer(request.url)
+        # Load the profile (for the match score) while the offer is scraped
+        job_data, profile = await asyncio.gather(
+            fetch_job_offer_async(request.url),
+            asyncio.to_thread(load_profile)
+        )
         
         if not job_data or not job_data.get('title'):
             raise HTTPException(status_code=400, detail="Could not scrape job offer")
         
-        # Language is already detected by fetch_job_offer
+        # Language is already detected by parse_job_offer
         language = job_data.get('language', 'fr')
         
-        # Logo URL is extracted by fetch_job_offer
+        # Logo URL is extracted by parse_job_offer
         logo_url = job_data.get('logo_url')
         primary_color = job_data.get('primary_color', '#10b981')
         
         # Calculate match score
-        profile = load_profile_from_file()
         description = job_data.get('description', '').lower()
-        skills = profile.get('skills', [])
-        matched = sum(1 for skill in skills if skill.lower() in description)
+        matched = len(set(skills_pattern(profile_skills(profile)).findall(description)))
         match_score = min(95, 60 + (matched * 5))
         
         # Generate unique ID for this application
-        app_id = str(uuid.uuid4())[:8]
+        app_id = secrets.token_hex(4)
         
         # Store temporary data for generation
         temp_data = {
@@ -341,7 +693,7 @@ def analyze_job(request: JobUrlRequest):
             "created_at": datetime.now().isoformat()
         }
         
-        save_temp_analysis(temp_data)
+        await asyncio.to_thread(save_temp_analysis, temp_data)
         
         return {
             "id": app_id,
@@ -360,45 +712,37 @@ def analyze_job(request: JobUrlRequest):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/preview")
-def preview_documents(request: GenerateRequest):
+async def preview_documents(request: GenerateRequest):
     """Generate preview data for editing before final generation"""
     try:
         # Load temp data
-        temp_data = get_temp_analysis(request.id)
+        temp_data = await asyncio.to_thread(get_temp_analysis, request.id)
         if not temp_data:
             raise HTTPException(status_code=404, detail="Application not found")
         
         job_data = temp_data['job_data']
         language = job_data.get('language', 'fr')
         
-        # Load profile
-        profile = load_profile_from_file()
-        
-        # Translate profile if English
-        if language == "en":
-            profile = translate_profile_to_english(profile)
+        # Load profile (translated if English)
+        profile = await asyncio.to_thread(load_profile, language)
         
         # Adapt profile to job
         adapted = adapt_profile(profile, job_data)
         
         # Generate cover letter content with Mistral
-        cover_letter = generate_cover_with_mistral(profile, job_data, adapted.get("job_context", {}))
+        cover_letter = await asyncio.to_thread(generate_cover_with_mistral, profile, job_data, adapted.get("job_context", {}))
         
         # If Mistral failed, create default structure
         if not cover_letter:
             company = job_data.get("company", "l'entreprise")
             position = job_data.get("title", "le poste")
             cover_letter = {
-                "accroche": f"Fort de mon expérience en data engineering et développement, je suis particulièrement intéressé par le poste de {position} chez {company}.",
-                "entreprise": f"{company} est reconnue pour son expertise et son innovation. Votre vision et vos projets correspondent parfaitement à mes aspirations professionnelles.",
-                "moi": "Mon parcours m'a permis de développer des compétences solides en conception de pipelines de données, orchestration et déploiement cloud. J'ai notamment travaillé sur des projets d'envergure impliquant le traitement de données massives.",
-                "nous": "Ensemble, nous pourrions relever les défis de modernisation de vos infrastructures data et contribuer à la création de valeur à partir de vos données.",
-                "conclusion": "Je serais ravi d'échanger avec vous lors d'un entretien pour discuter de cette opportunité. Dans l'attente de votre retour, je vous prie d'agréer mes salutations distinguées."
+                key: text.format(position=position, company=company)
+                for key, text in DEFAULT_PREVIEW_COVER_LETTER.items()
             }
         
         # Extract editable CV data
@@ -412,21 +756,10 @@ def preview_documents(request: GenerateRequest):
                 }
                 for skill in adapted.get("skills", [])[:6]
             ],
-            "projects": [
-                {
-                    "name": "DataFlow Pipeline",
-                    "description": "Pipeline de données temps réel avec Apache Kafka et Spark pour le traitement de millions d'événements par jour",
-                    "technologies": "Python, Kafka, Spark, Docker, AWS"
-                },
-                {
-                    "name": "ML Model Serving Platform",
-                    "description": "Plateforme de déploiement de modèles ML avec API REST, monitoring et auto-scaling",
-                    "technologies": "FastAPI, MLflow, Kubernetes, PostgreSQL"
-                }
-            ]
+            "projects": [dict(project) for project in DEFAULT_PREVIEW_PROJECTS]
         }
         
-        return {
+        return ORJSONResponse({
             "id": request.id,
             "cv": cv_data,
             "coverLetter": cover_letter,
@@ -436,21 +769,20 @@ def preview_documents(request: GenerateRequest):
                 "location": job_data.get("location", ""),
                 "language": language
             }
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/generate")
-def generate_documents(request: GenerateRequest):
+async def generate_documents(request: GenerateRequest, background_tasks: BackgroundTasks):
     """Generate CV and cover letter"""
     try:
         # Load temp data
-        temp_data = get_temp_analysis(request.id)
+        temp_data = await asyncio.to_thread(get_temp_analysis, request.id)
         if not temp_data:
             raise HTTPException(status_code=404, detail="Application not found")
         
@@ -458,41 +790,32 @@ def generate_documents(request: GenerateRequest):
         language = job_data.get('language', 'fr')
         logo_url = temp_data.get('logo_url')
         
-        # Load profile
-        profile = load_profile_from_file()
-        
-        # Translate profile if English
-        if language == "en":
-            profile = translate_profile_to_english(profile)
+        # Load profile (translated if English)
+        profile = await asyncio.to_thread(load_profile, language)
         
         # Adapt profile to job (signature: profile, job_data)
         adapted = adapt_profile(profile, job_data)
         
-        # Use temp directory for serverless compatibility
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            
-            # Generate CV - writes to file
+        # Use a pooled scratch directory (temp storage for serverless compatibility)
+        async with borrow_work_dir(request.id) as tmp_path:
             cv_filename = f"cv_{request.id}.pdf"
             cv_tex_path = tmp_path / f"cv_{request.id}.tex"
-            generate_cv(adapted, cv_tex_path)
-            
-            # Compile CV to PDF
-            compile_latex(cv_tex_path)
             cv_pdf_path = tmp_path / cv_filename
-            
-            # Generate cover letter - writes to file
             cover_filename = f"cover_{request.id}.pdf"
             cover_tex_path = tmp_path / f"cover_{request.id}.tex"
-            generate_cover_letter(adapted, cover_tex_path, profile=profile)
-            
-            # Compile cover letter to PDF
-            compile_latex(cover_tex_path)
             cover_pdf_path = tmp_path / cover_filename
             
-            # Upload PDFs to storage
-            cv_url = upload_pdf(cv_pdf_path, cv_filename)
-            cover_url = upload_pdf(cover_pdf_path, cover_filename)
+            # Build the CV and the cover letter PDFs concurrently
+            await asyncio.gather(
+                asyncio.to_thread(build_cv, adapted, cv_tex_path),
+                asyncio.to_thread(build_cover_letter, adapted, cover_tex_path, profile)
+            )
+            
+            # Upload PDFs to storage in parallel
+            cv_url, cover_url = await asyncio.gather(
+                upload_pdf_async(cv_pdf_path, cv_filename),
+                upload_pdf_async(cover_pdf_path, cover_filename)
+            )
         
         # Create application record
         company_name = job_data.get('company', 'Unknown')
@@ -515,35 +838,31 @@ def generate_documents(request: GenerateRequest):
         }
         
         # Save application
-        save_application(application)
-        
-        # Clean temp analysis data
-        delete_temp_analysis(request.id)
+        await asyncio.to_thread(save_application, application)
         
-        # Return paths via backend download endpoint (not direct Supabase URLs)
-        cv_download_path = f"/api/download/{cv_filename}"
-        cover_download_path = f"/api/download/{cover_filename}"
+        # Clean temp analysis data once the response is sent
+        background_tasks.add_task(delete_temp_analysis, request.id)
         
-        return {
+        # Return storage URLs (Supabase public URLs or local download paths)
+        return ORJSONResponse({
             "success": True,
-            "cvPath": cv_download_path,
-            "coverPath": cover_download_path,
+            "cvPath": cv_url,
+            "coverPath": cover_url,
             "application": application
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/finalize")
-def finalize_documents(request: FinalizeRequest):
+async def finalize_documents(request: FinalizeRequest, background_tasks: BackgroundTasks):
     """Generate final PDFs with edited content"""
     try:
         # Load temp data
-        temp_data = get_temp_analysis(request.id)
+        temp_data = await asyncio.to_thread(get_temp_analysis, request.id)
         if not temp_data:
             raise HTTPException(status_code=404, detail="Application not found")
         
@@ -551,82 +870,42 @@ def finalize_documents(request: FinalizeRequest):
         language = job_data.get('language', 'fr')
         logo_url = temp_data.get('logo_url')
         
-        # Load profile
-        profile = load_profile_from_file()
-        
-        # Translate profile if English
-        if language == "en":
-            profile = translate_profile_to_english(profile)
+        # Load profile (translated if English)
+        profile = await asyncio.to_thread(load_profile, language)
         
         # Adapt profile to job
         adapted = adapt_profile(profile, job_data)
         
-        # Apply user edits to CV
-        adapted["summary"] = request.cv.summary
-        adapted["display_title"] = request.cv.display_title
-        
-        # Apply user edits to skills
-        adapted["skills"] = [
-            {"label": skill.label, "items": skill.items}
-            for skill in request.cv.skills
-        ]
+        # User edits, already validated by the request model (also stored for future editing)
+        cv_data_to_store = request.cv.model_dump()
+        cover_data_to_store = request.coverLetter.model_dump()
         
-        # Apply user edits to projects
-        adapted["projects"] = [
-            {"name": proj.name, "description": proj.description, "technologies": proj.technologies}
-            for proj in request.cv.projects
-        ]
+        # Apply user edits to CV (summary, title, skills and projects)
+        adapted.update(cv_data_to_store)
         
         # Apply user edits to cover letter
-        cover_letter_content = {
-            "accroche": request.coverLetter.accroche,
-            "entreprise": request.coverLetter.entreprise,
-            "moi": request.coverLetter.moi,
-            "nous": request.coverLetter.nous,
-            "conclusion": request.coverLetter.conclusion
-        }
-        adapted["cover_letter"] = cover_letter_content
+        adapted["cover_letter"] = cover_data_to_store
         
-        # Use temp directory for serverless compatibility
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            
-            # Generate CV - writes to file
+        # Use a pooled scratch directory (temp storage for serverless compatibility)
+        async with borrow_work_dir(request.id) as tmp_path:
             cv_filename = f"cv_{request.id}.pdf"
             cv_tex_path = tmp_path / f"cv_{request.id}.tex"
-            generate_cv(adapted, cv_tex_path)
-            
-            # Compile CV to PDF
-            compile_latex(cv_tex_path)
             cv_pdf_path = tmp_path / cv_filename
-            
-            # Generate cover letter with edited content
             cover_filename = f"cover_{request.id}.pdf"
             cover_tex_path = tmp_path / f"cover_{request.id}.tex"
-            generate_cover_letter(adapted, cover_tex_path, profile=profile)
-            
-            # Compile cover letter to PDF
-            compile_latex(cover_tex_path)
             cover_pdf_path = tmp_path / cover_filename
             
-            # Upload PDFs to storage
-            cv_url = upload_pdf(cv_pdf_path, cv_filename)
-            cover_url = upload_pdf(cover_pdf_path, cover_filename)
-        
-        # Store CV and cover letter data for future editing
-        cv_data_to_store = {
-            "summary": request.cv.summary,
-            "display_title": request.cv.display_title,
-            "skills": [{"label": s.label, "items": s.items} for s in request.cv.skills],
-            "projects": [{"name": p.name, "description": p.description, "technologies": p.technologies} for p in request.cv.projects]
-        }
-        cover_data_to_store = {
-            "accroche": request.coverLetter.accroche,
-            "entreprise": request.coverLetter.entreprise,
-            "moi": request.coverLetter.moi,
-            "nous": request.coverLetter.nous,
-            "conclusion": request.coverLetter.conclusion
-        }
+            # Build the CV and the cover letter PDFs concurrently
+            await asyncio.gather(
+                asyncio.to_thread(build_cv, adapted, cv_tex_path),
+                asyncio.to_thread(build_cover_letter, adapted, cover_tex_path, profile)
+            )
+            
+            # Upload PDFs to storage in parallel
+            cv_url, cover_url = await asyncio.gather(
+                upload_pdf_async(cv_pdf_path, cv_filename),
+                upload_pdf_async(cover_pdf_path, cover_filename)
+            )
         
         # Create application record with editable data
         company_name = job_data.get('company', 'Unknown')
@@ -651,80 +930,65 @@ def finalize_documents(request: FinalizeRequest):
         }
         
         # Save application
-        save_application(application)
-        
-        # Clean temp analysis data
-        delete_temp_analysis(request.id)
+        await asyncio.to_thread(save_application, application)
         
-        # Return paths via backend download endpoint
-        cv_download_path = f"/api/download/{cv_filename}"
-        cover_download_path = f"/api/download/{cover_filename}"
+        # Clean temp analysis data once the response is sent
+        background_tasks.add_task(delete_temp_analysis, request.id)
         
-        return {
+        # Return storage URLs (Supabase public URLs or local download paths)
+        return ORJSONResponse({
             "success": True,
-            "cvPath": cv_download_path,
-            "coverPath": cover_download_path,
+            "cvPath": cv_url,
+            "coverPath": cover_url,
             "application": application
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/download/{filename}")
-def download_file(filename: str):
+async def download_file(filename: str):
     """Download a generated PDF"""
-    content = get_pdf_content(filename)
-    if not content:
+    if supabase:
+        # Let the client fetch the file from the Supabase CDN directly
+        return RedirectResponse(url=public_pdf_url(filename), status_code=307)
+    
+    file_path = get_pdf_path(filename)
+    if not file_path:
         raise HTTPException(status_code=404, detail="File not found")
     
-    return Response(
-        content=content,
+    # Streamed in chunks with Content-Length and Range support
+    return FileResponse(
+        file_path,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 @app.delete("/api/applications/{app_id}")
-def delete_application(app_id: str):
+async def delete_application(app_id: str):
     """Delete an application"""
-    if supabase:
-        # Delete from Supabase
-        supabase.table("applications").delete().eq("id", app_id).execute()
-        
-        # Also delete associated PDFs from storage
-        try:
-            supabase.storage.from_("documents").remove([f"cv_{app_id}.pdf", f"cover_{app_id}.pdf"])
-        except:
-            pass
-    else:
-        applications = load_applications_local()
-        applications = [a for a in applications if a['id'] != app_id]
-        save_applications_local(applications)
+    # The record and its PDFs are independent, delete them concurrently
+    await asyncio.gather(
+        asyncio.to_thread(remove_application, app_id),
+        asyncio.to_thread(remove_application_pdfs, app_id)
+    )
     
     return {"success": True}
 
 @app.patch("/api/applications/{app_id}/status")
-def update_application_status(app_id: str, body: StatusUpdateRequest):
+async def update_application_status(app_id: str, body: StatusUpdateRequest):
     """Update application status"""
-    if supabase:
-        supabase.table("applications").update({"status": body.status}).eq("id", app_id).execute()
-    else:
-        applications = load_applications_local()
-        for app in applications:
-            if app['id'] == app_id:
-                app['status'] = body.status
-                break
-        save_applications_local(applications)
+    await asyncio.to_thread(update_application, app_id, {"status": body.status})
     
     return {"success": True}
 
 @app.get("/api/applications/{app_id}/edit")
-def get_application_for_edit(app_id: str):
+async def get_application_for_edit(app_id: str):
     """Get application data for editing"""
-    app = get_application_by_id(app_id)
+    app = await asyncio.to_thread(get_application_by_id, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     
@@ -734,41 +998,24 @@ def get_application_for_edit(app_id: str):
     
     # If no stored data, create defaults from profile
     if not cv_data:
-        profile = load_profile_from_file()
-        language = app.get("language", "fr")
-        if language == "en":
-            profile = translate_profile_to_english(profile)
+        profile = await asyncio.to_thread(load_profile, app.get("language", "fr"))
         
         cv_data = {
             "summary": profile.get("summary", ""),
             "display_title": app.get("position", ""),
             "skills": profile.get("skills", []),
-            "projects": [
-                {
-                    "name": "DataFlow Pipeline",
-                    "description": "Pipeline de données temps réel avec Apache Kafka et Spark",
-                    "technologies": "Python, Kafka, Spark, Docker, AWS"
-                },
-                {
-                    "name": "ML Model Serving Platform",
-                    "description": "Plateforme de déploiement de modèles ML avec API REST",
-                    "technologies": "FastAPI, MLflow, Kubernetes, PostgreSQL"
-                }
-            ]
+            "projects": [dict(project) for project in DEFAULT_EDIT_PROJECTS]
         }
     
     if not cover_data:
         company = app.get("company", "l'entreprise")
         position = app.get("position", "le poste")
         cover_data = {
-            "accroche": f"Fort de mon expérience, je suis particulièrement intéressé par le poste de {position} chez {company}.",
-            "entreprise": f"{company} est reconnue pour son expertise et son innovation.",
-            "moi": "Mon parcours m'a permis de développer des compétences solides en conception et développement.",
-            "nous": "Ensemble, nous pourrions relever les défis techniques et contribuer à la création de valeur.",
-            "conclusion": "Je serais ravi d'échanger avec vous lors d'un entretien. Dans l'attente de votre retour, je vous prie d'agréer mes salutations distinguées."
+            key: text.format(position=position, company=company)
+            for key, text in DEFAULT_EDIT_COVER_LETTER.items()
         }
     
-    return {
+    return ORJSONResponse({
         "id": app_id,
         "cv": cv_data,
         "coverLetter": cover_data,
@@ -778,34 +1025,38 @@ def get_application_for_edit(app_id: str):
             "location": app.get("location", ""),
             "language": app.get("language", "fr")
         }
-    }
+    })
 
 @app.post("/api/applications/{app_id}/regenerate")
-def regenerate_documents(app_id: str, request: FinalizeRequest):
+async def regenerate_documents(app_id: str, request: FinalizeRequest):
     """Regenerate documents for an existing application"""
     try:
-        app = get_application_by_id(app_id)
+        app = await asyncio.to_thread(get_application_by_id, app_id)
         if not app:
             raise HTTPException(status_code=404, detail="Application not found")
         
         language = app.get("language", "fr")
         
-        # Load profile
-        profile = load_profile_from_file()
+        # Load profile (translated if English)
+        profile = await asyncio.to_thread(load_profile, language)
         
-        # Translate profile if English
-        if language == "en":
-            profile = translate_profile_to_english(profile)
+        # User edits, already validated by the request model (also stored for future editing)
+        cv_data_to_store = request.cv.model_dump()
+        cover_data_to_store = request.coverLetter.model_dump()
         
         # Create adapted data from request
         adapted = {
             "personal": profile.get("personal", {}),
-            "summary": request.cv.summary,
-            "display_title": request.cv.display_title,
-            "experiences": profile.get("experiences", []),
+            "summary": cv_data_to_store["summary"],
+            "display_title": cv_data_to_store["display_title"],
+            # Copied with their first 4 bullets selected, the cached profile stays untouched
+            "experiences": [
+                {**exp, "selected_bullets": exp.get("bullets", ())[:4]}
+                for exp in profile.get("experiences", [])
+            ],
             "education": profile.get("education", []),
-            "skills": [{"label": s.label, "items": s.items} for s in request.cv.skills],
-            "projects": [{"name": p.name, "description": p.description, "technologies": p.technologies} for p in request.cv.projects],
+            "skills": cv_data_to_store["skills"],
+            "projects": cv_data_to_store["projects"],
             "certifications": profile.get("certifications", []),
             "languages": profile.get("languages", []),
             "interests": profile.get("interests", []),
@@ -822,59 +1073,29 @@ def regenerate_documents(app_id: str, request: FinalizeRequest):
             "qualites": [],
             "projets_marquants": [],
             # Edited cover letter content (takes priority)
-            "cover_letter": {
-                "accroche": request.coverLetter.accroche,
-                "entreprise": request.coverLetter.entreprise,
-                "moi": request.coverLetter.moi,
-                "nous": request.coverLetter.nous,
-                "conclusion": request.coverLetter.conclusion
-            }
+            "cover_letter": cover_data_to_store
         }
         
-        # Select bullets for experiences (use first 4 bullets per experience)
-        for exp in adapted["experiences"]:
-            exp["selected_bullets"] = exp.get("bullets", [])[:4]
-        
-        # Use temp directory for serverless compatibility
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            
-            # Generate CV
+        # Use a pooled scratch directory (temp storage for serverless compatibility)
+        async with borrow_work_dir(app_id) as tmp_path:
             cv_filename = f"cv_{app_id}.pdf"
             cv_tex_path = tmp_path / f"cv_{app_id}.tex"
-            generate_cv(adapted, cv_tex_path)
-            
-            # Compile CV to PDF
-            compile_latex(cv_tex_path)
             cv_pdf_path = tmp_path / cv_filename
-            
-            # Generate cover letter
             cover_filename = f"cover_{app_id}.pdf"
             cover_tex_path = tmp_path / f"cover_{app_id}.tex"
-            generate_cover_letter(adapted, cover_tex_path, profile=profile)
-            
-            # Compile cover letter to PDF
-            compile_latex(cover_tex_path)
             cover_pdf_path = tmp_path / cover_filename
             
-            # Upload PDFs to storage (overwrite existing)
-            cv_url = upload_pdf(cv_pdf_path, cv_filename)
-            cover_url = upload_pdf(cover_pdf_path, cover_filename)
-        
-        # Store updated CV and cover letter data
-        cv_data_to_store = {
-            "summary": request.cv.summary,
-            "display_title": request.cv.display_title,
-            "skills": [{"label": s.label, "items": s.items} for s in request.cv.skills],
-            "projects": [{"name": p.name, "description": p.description, "technologies": p.technologies} for p in request.cv.projects]
-        }
-        cover_data_to_store = {
-            "accroche": request.coverLetter.accroche,
-            "entreprise": request.coverLetter.entreprise,
-            "moi": request.coverLetter.moi,
-            "nous": request.coverLetter.nous,
-            "conclusion": request.coverLetter.conclusion
-        }
+            # Build the CV and the cover letter PDFs concurrently
+            await asyncio.gather(
+                asyncio.to_thread(build_cv, adapted, cv_tex_path),
+                asyncio.to_thread(build_cover_letter, adapted, cover_tex_path, profile)
+            )
+            
+            # Upload PDFs to storage in parallel (overwrite existing)
+            cv_url, cover_url = await asyncio.gather(
+                upload_pdf_async(cv_pdf_path, cv_filename),
+                upload_pdf_async(cover_pdf_path, cover_filename)
+            )
         
         # Update application in database
         update_data = {
@@ -883,22 +1104,18 @@ def regenerate_documents(app_id: str, request: FinalizeRequest):
             "cv_data": cv_data_to_store,
             "cover_data": cover_data_to_store
         }
-        update_application(app_id, update_data)
-        
-        # Return paths via backend download endpoint
-        cv_download_path = f"/api/download/{cv_filename}"
-        cover_download_path = f"/api/download/{cover_filename}"
+        await asyncio.to_thread(update_application, app_id, update_data)
         
+        # Return storage URLs (Supabase public URLs or local download paths)
         return {
             "success": True,
-            "cvPath": cv_download_path,
-            "coverPath": cover_download_path
+            "cvPath": cv_url,
+            "coverPath": cover_url
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -921,8 +1138,7 @@ def analyze_email_with_mistral(email_content: str, company: str) -> dict:
         return analyze_email_simple(email_content)
     
     try:
-        from mistralai import Mistral
-        client = Mistral(api_key=mistral_api_key)
+        client = get_mistral_client()
         
         prompt = f"""Analyse cet email de recruteur et retourne un JSON avec les informations suivantes:
 - emailType: "acknowledgment" (accusé réception), "rejection" (refus), "interview" (proposition d'entretien), "offer" (offre d'embauche), "followup" (relance/suivi), "unknown"
@@ -950,7 +1166,7 @@ Réponds UNIQUEMENT avec le JSON, sans markdown ni explication."""
             if result_text.startswith("json"):
                 result_text = result_text[4:]
         
-        return json.loads(result_text)
+        return orjson.loads(result_text)
     except Exception as e:
         print(f"Mistral analysis failed: {e}")
         return analyze_email_simple(email_content)
@@ -1002,21 +1218,21 @@ def analyze_email_simple(email_content: str) -> dict:
         }
 
 @app.post("/api/applications/{app_id}/analyze-email")
-def analyze_email(app_id: str, request: EmailAnalysisRequest):
+async def analyze_email(app_id: str, request: EmailAnalysisRequest):
     """Analyze an email to determine application status update"""
-    app = get_application_by_id(app_id)
+    app = await asyncio.to_thread(get_application_by_id, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     
     company = app.get("company", "Unknown")
-    result = analyze_email_with_mistral(request.content, company)
+    result = await asyncio.to_thread(analyze_email_with_mistral, request.content, company)
     
     return result
 
 @app.patch("/api/applications/{app_id}/update-from-email")
-def update_from_email(app_id: str, request: EmailUpdateRequest):
+async def update_from_email(app_id: str, request: EmailUpdateRequest):
     """Update application based on email analysis"""
-    app = get_application_by_id(app_id)
+    app = await asyncio.to_thread(get_application_by_id, app_id)
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     
@@ -1032,7 +1248,7 @@ def update_from_email(app_id: str, request: EmailUpdateRequest):
         new_notes = f"{existing_notes}\n[{datetime.now().strftime('%d/%m/%Y')}] {request.notes}" if existing_notes else f"[{datetime.now().strftime('%d/%m/%Y')}] {request.notes}"
         update_data["notes"] = new_notes.strip()
     
-    update_application(app_id, update_data)
+    await asyncio.to_thread(update_application, app_id, update_data)
     
     return {"success": True}
 
@@ -1057,7 +1273,7 @@ async def receive_inbound_email(
         # Strategy 1: Match by sender domain
         sender_domain = sender.split("@")[-1].lower() if "@" in sender else ""
         
-        apps = get_applications()
+        apps = await asyncio.to_thread(get_applications)
         matched_app = None
         
         for app in apps:
@@ -1075,7 +1291,7 @@ async def receive_inbound_email(
             return {"status": "ignored", "reason": "no matching application found"}
         
         # Analyze the email
-        result = analyze_email_with_mistral(email_content, matched_app.get("company", ""))
+        result = await asyncio.to_thread(analyze_email_with_mistral, email_content, matched_app.get("company", ""))
         
         # Auto-update the application
         update_data = {"status": result["suggestedStatus"]}
@@ -1088,7 +1304,7 @@ async def receive_inbound_email(
             new_note = f"[{datetime.now().strftime('%d/%m/%Y')} - Auto] {result['notes']}"
             update_data["notes"] = f"{existing_notes}\n{new_note}".strip()
         
-        update_application(matched_app["id"], update_data)
+        await asyncio.to_thread(update_application, matched_app["id"], update_data)
         
         return {
             "status": "processed",
@@ -1098,7 +1314,6 @@ async def receive_inbound_email(
         }
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return {"status": "error", "message": str(e)}
 
@@ -10,20 +10,29 @@ Exemple:
     python generate.py "https://www.welcometothejungle.com/fr/companies/xxx/jobs/yyy"
 """
 
+import hashlib
+import importlib.util
 import json
 import os
 import re
+import secrets
+import shutil
 import subprocess
 import sys
+import time
 import io
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from html import unescape
 from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse
 
-import requests
+import orjson
+import soupsieve
 from bs4 import BeautifulSoup
-from PIL import Image
 
 # Charger les variables d'environnement depuis .env
 def load_dotenv():
@@ -42,34 +51,180 @@ def load_dotenv():
 
 load_dotenv()
 
-# Mistral AI
-try:
-    from mistralai import Mistral
-    MISTRAL_AVAILABLE = True
-except ImportError:
-    MISTRAL_AVAILABLE = False
-
-# ColorThief pour extraction de couleurs
-try:
-    from colorthief import ColorThief
-    COLORTHIEF_AVAILABLE = True
-except ImportError:
-    COLORTHIEF_AVAILABLE = False
+# Dépendances lourdes (Mistral, langdetect, Pillow) : on vérifie seulement leur présence ici,
+# l'import réel se fait au premier usage pour garder un démarrage rapide
+MISTRAL_AVAILABLE = importlib.util.find_spec("mistralai") is not None
+LANGDETECT_AVAILABLE = importlib.util.find_spec("langdetect") is not None
 
-# Détection de langue
+# Parseur HTML : lxml (C) si disponible, sinon le parseur Python intégré
 try:
-    from langdetect import detect as detect_language
-    LANGDETECT_AVAILABLE = True
+    import lxml
+    HTML_PARSER = "lxml"
 except ImportError:
-    LANGDETECT_AVAILABLE = False
+    HTML_PARSER = "html.parser"
 
 # Configuration
 PROFILE_PATH = Path(__file__).parent / "profile.json"
 CV_TEMPLATE_PATH = Path(__file__).parent / "templates" / "cv_template.tex"
 COVER_TEMPLATE_PATH = Path(__file__).parent / "templates" / "cover_template.tex"
 OUTPUT_DIR = Path(__file__).parent / "output"
+CACHE_DIR = OUTPUT_DIR / ".cache"
+OFFER_CACHE_TTL = 3600  # secondes
 MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY", "")
 MISTRAL_MODEL = os.environ.get("MISTRAL_MODEL", "mistral-small-latest")
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+IMAGE_HEADERS = {"Accept": "image/webp,image/apng,image/*,*/*;q=0.8"}
+
+# Expressions régulières compilées une seule fois
+COMPANY_SLUG_RE = re.compile(r'/companies/([^/]+)')
+WTTJ_JOB_PATH_RE = re.compile(r'/companies/([^/]+)/jobs/([^/?]+)')
+WTTJ_ID_SUFFIX_RE = re.compile(r'_[A-Z]{2,}_[A-Za-z0-9]+$')
+TITLE_DASH_RE = re.compile(r'\s*[-–—]\s+.*$')
+TITLE_GENDER_RE = re.compile(r'\s*[\(\[]\s*[xXhHfFmM]\s*/?\s*[xXhHfFmM]\s*/?\s*[xXhHfFmM]?\s*[\)\]]?\s*$')
+TITLE_HF_RE = re.compile(r'\s+[HhFf]\s*/?\s*[HhFf]\s*$')
+MD_FENCE_OPEN_RE = re.compile(r'^```json?\n?')
+MD_FENCE_CLOSE_RE = re.compile(r'\n?```$')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+HTML_LI_RE = re.compile(r'<li\b[^>]*>(.*?)</li>', re.DOTALL | re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+NON_WORD_RE = re.compile(r'[^\w\s]')
+TEAM_SIZE_RE = re.compile(r'équipe\s+(?:data\s+)?(?:de\s+)?(\d+)')
+WTTJ_INITIAL_DATA_RE = re.compile(rb'window\.__INITIAL_DATA__\s*=\s*"(.+?)"(?:\s|;)')
+# Lettres Unicode (accents compris) : apostrophes, parenthèses et espaces séparent les mots
+SKILL_TOKEN_RE = re.compile(r'[\w+#./-]+')
+
+
+_HTTP_SESSION = None
+_MISTRAL_CLIENT = None
+
+
+def get_http_session():
+    """Session HTTP partagée (keep-alive entre l'offre, la page entreprise et les logos), créée au premier usage"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        session = requests.Session()
+        session.headers.update(FETCH_HEADERS)
+        session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+
+def get_mistral_client():
+    """Client Mistral partagé, ses connexions HTTP sont réutilisées d'un appel à l'autre"""
+    global _MISTRAL_CLIENT
+    if _MISTRAL_CLIENT is None:
+        from mistralai import Mistral
+        _MISTRAL_CLIENT = Mistral(api_key=MISTRAL_API_KEY)
+    return _MISTRAL_CLIENT
+
+
+def strip_markdown_fence(content: str) -> str:
+    """Enlève les backticks markdown autour d'une réponse JSON"""
+    return MD_FENCE_CLOSE_RE.sub('', MD_FENCE_OPEN_RE.sub('', content))
+
+
+def html_fragment_to_text(fragment: str) -> str:
+    """Texte d'un fragment HTML, une ligne par bloc de texte (équivalent de get_text('\\n', strip=True))"""
+    text = unescape(HTML_TAG_RE.sub('\n', fragment))
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def html_list_items(fragment: str) -> list:
+    """Texte de chaque <li> d'un fragment HTML, espaces normalisés"""
+    return [
+        item for item in (
+            WHITESPACE_RE.sub(' ', unescape(HTML_TAG_RE.sub(' ', li))).strip()
+            for li in HTML_LI_RE.findall(fragment)
+        ) if item
+    ]
+
+
+def skill_tokens(text: str) -> list:
+    """Mots d'un texte en minuscules, ponctuation finale retirée ("d'équipe" -> ["d", "équipe"])"""
+    return [token for token in (t.rstrip('./-') for t in SKILL_TOKEN_RE.findall(text)) if token]
+
+
+def compound_parts(tokens: list) -> list:
+    """Mots composés découpés sur "/" et "." (["dataflow/pub/sub"] -> ["dataflow", "pub", "sub"])"""
+    return [part for token in tokens for part in token.replace('/', '.').split('.') if part]
+
+
+def skill_ngram_keys(item_lower: str) -> tuple:
+    """Formes d'une compétence à chercher dans text_ngrams : entière et découpée ("pub/sub", "pub sub")"""
+    tokens = skill_tokens(item_lower)
+    return " ".join(tokens), " ".join(compound_parts(tokens))
+
+
+def text_ngrams(text: str, max_n: int = 3) -> set:
+    """Ensemble des n-grammes de mots (1 à max_n) d'un texte en minuscules
+    
+    Les mots composés sont gardés entiers ("pub/sub", "node.js") et découpés sur "/" et "."
+    ("next.js/react.js" -> "next", "js", "react", "js") : "React" est trouvé dans "Next.js/React.js".
+    """
+    tokens = skill_tokens(text)
+    parts = compound_parts(tokens)
+    ngrams = set(tokens)
+    ngrams.update(parts)
+    for sequence in (tokens, parts):
+        for n in range(2, max_n + 1):
+            ngrams.update(" ".join(sequence[i:i + n]) for i in range(len(sequence) - n + 1))
+    return ngrams
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Écrit un fichier texte via un fichier temporaire + os.replace : jamais de fichier à moitié écrit"""
+    tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def clean_job_title(title: str) -> str:
+    """Nettoie un titre d'offre (suffixe après tiret, mentions H/F)"""
+    title = TITLE_DASH_RE.sub('', title)
+    title = TITLE_GENDER_RE.sub('', title)
+    title = TITLE_HF_RE.sub('', title)
+    return title.strip()
+
+
+# Indicateurs de langue pour detect_offer_language
+# Ces mots n'existent pas en anglais et sont très courants dans les offres françaises
+STRONG_FRENCH_INDICATORS = ["vous", "nous", "votre", "notre", "être", "avoir", 
+                            "poste", "rejoindre", "rejoignez", "postuler", 
+                            "télétravail", "salaire", "candidature", "contrat",
+                            "équipe", "entreprise", "missions", "avantages",
+                            "profil recherché", "ce que nous offrons", "vos missions"]
+STRONG_ENGLISH_INDICATORS = ["you will", "we are", "you are", "your role", 
+                             "responsibilities", "requirements", "about us",
+                             "what we offer", "who you are", "what you'll do"]
+FRENCH_WORDS = ["poste", "vous", "nous", "équipe", "entreprise", "rejoindre", 
+                "candidature", "profil", "missions", "avantages", "salaire",
+                "expérience", "compétences", "formation", "télétravail",
+                "votre", "notre", "être", "avoir", "pour", "dans", "avec"]
+ENGLISH_WORDS = ["you", "we", "team", "company", "join", "application", 
+                 "profile", "responsibilities", "benefits", "salary",
+                 "experience", "skills", "education", "remote", "role",
+                 "your", "our", "about", "will", "with"]
+
+
+def substring_pattern(words: list) -> re.Pattern:
+    """Regex trouvant en une passe chaque occurrence (même chevauchante) des mots"""
+    return re.compile("(?=(" + "|".join(map(re.escape, words)) + "))")
+
+
+def word_pattern(words: list) -> re.Pattern:
+    """Regex trouvant en une passe les mots délimités par des espaces"""
+    return re.compile("(?<![^ ])(" + "|".join(map(re.escape, words)) + ")(?![^ ])")
+
+
+STRONG_FRENCH_RE = substring_pattern(STRONG_FRENCH_INDICATORS)
+STRONG_ENGLISH_RE = substring_pattern(STRONG_ENGLISH_INDICATORS)
+FRENCH_WORDS_RE = word_pattern(FRENCH_WORDS)
+ENGLISH_WORDS_RE = word_pattern(ENGLISH_WORDS)
 
 
 def detect_offer_language(text: str) -> str:
@@ -79,27 +234,15 @@ def detect_offer_language(text: str) -> str:
     
     text_lower = text.lower()
     
-    # D'abord, vérifier les indicateurs forts de langue française
-    # Ces mots n'existent pas en anglais et sont très courants dans les offres françaises
-    strong_french_indicators = ["vous", "nous", "votre", "notre", "être", "avoir", 
-                                 "poste", "rejoindre", "rejoignez", "postuler", 
-                                 "télétravail", "salaire", "candidature", "contrat",
-                                 "équipe", "entreprise", "missions", "avantages",
-                                 "profil recherché", "ce que nous offrons", "vos missions"]
-    
-    # Compter les indicateurs français forts
-    french_strong = sum(1 for w in strong_french_indicators if w in text_lower)
+    # D'abord, compter les indicateurs forts de langue française (un seul parcours du texte)
+    french_strong = len(set(STRONG_FRENCH_RE.findall(text_lower)))
     
     # Si on trouve plusieurs indicateurs français forts, c'est du français
     if french_strong >= 3:
         return "fr"
     
     # Indicateurs forts anglais
-    strong_english_indicators = ["you will", "we are", "you are", "your role", 
-                                  "responsibilities", "requirements", "about us",
-                                  "what we offer", "who you are", "what you'll do"]
-    
-    english_strong = sum(1 for w in strong_english_indicators if w in text_lower)
+    english_strong = len(set(STRONG_ENGLISH_RE.findall(text_lower)))
     
     if english_strong >= 2:
         return "en"
@@ -107,6 +250,7 @@ def detect_offer_language(text: str) -> str:
     # Fallback sur langdetect si disponible
     if LANGDETECT_AVAILABLE:
         try:
+            from langdetect import detect as detect_language
             lang = detect_language(text[:3000])
             if lang == "fr":
                 return "fr"
@@ -121,22 +265,13 @@ def detect_offer_language(text: str) -> str:
             pass
     
     # Fallback final: détection par mots-clés
-    french_words = ["poste", "vous", "nous", "équipe", "entreprise", "rejoindre", 
-                    "candidature", "profil", "missions", "avantages", "salaire",
-                    "expérience", "compétences", "formation", "télétravail",
-                    "votre", "notre", "être", "avoir", "pour", "dans", "avec"]
-    
-    english_words = ["you", "we", "team", "company", "join", "application", 
-                     "profile", "responsibilities", "benefits", "salary",
-                     "experience", "skills", "education", "remote", "role",
-                     "your", "our", "about", "will", "with"]
-    
-    french_count = sum(1 for w in french_words if f" {w} " in f" {text_lower} ")
-    english_count = sum(1 for w in english_words if f" {w} " in f" {text_lower} ")
+    french_count = len(set(FRENCH_WORDS_RE.findall(text_lower)))
+    english_count = len(set(ENGLISH_WORDS_RE.findall(text_lower)))
     
     return "en" if english_count > french_count + 3 else "fr"
 
 
+@lru_cache(maxsize=64)
 def rgb_to_latex(rgb: Tuple[int, int, int]) -> str:
     """Convertit RGB en définition de couleur LaTeX"""
     return f"{rgb[0]}, {rgb[1]}, {rgb[2]}"
@@ -151,65 +286,44 @@ def extract_logo_url(soup: BeautifulSoup, url: str, company_name: str = "") -> O
         # Sur WTTJ, le logo est souvent dans une balise avec "logo" dans la classe
         # ou c'est une petite image carrée (pas une photo d'équipe rectangulaire)
         
-        # 1. Chercher d'abord les éléments avec "logo" explicitement
-        for img in soup.find_all("img"):
-            parent_classes = " ".join(img.parent.get("class", [])) if img.parent else ""
-            img_classes = " ".join(img.get("class", []))
-            all_classes = (parent_classes + " " + img_classes).lower()
-            
-            src = img.get("src", "")
-            
-            # Chercher les images avec "logo" dans les classes
-            if "logo" in all_classes and src:
-                # Exclure les logos WTTJ génériques
-                if "wttj" not in src.lower() and "welcometothejungle" not in src.lower():
-                    if "cdn-images.welcometothejungle.com" in src:
-                        logo_url = src
-                        break
+        cdn_img = "img[src*='cdn-images.welcometothejungle.com']"
+        
+        # 1. Chercher d'abord les images avec "logo" dans leur classe ou celle de leur parent
+        for img in soup.select(f"{cdn_img}[class*='logo' i], [class*='logo' i] > {cdn_img}"):
+            # Exclure les logos WTTJ génériques
+            if "wttj" not in img["src"].lower():
+                logo_url = img["src"]
+                break
         
         # 2. Chercher dans les liens vers le profil entreprise (sidebar)
         if not logo_url:
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "")
-                if "/companies/" in href and "/jobs" not in href:
-                    img = a.find("img")
-                    if img and img.get("src"):
-                        src = img.get("src")
-                        # Exclure les images WTTJ génériques
-                        if "wttj" not in src.lower() and "cdn-images.welcometothejungle.com" in src:
-                            logo_url = src
-                            break
+            for img in soup.select(f"a[href*='/companies/']:not([href*='/jobs']) {cdn_img}"):
+                if "wttj" not in img["src"].lower():
+                    logo_url = img["src"]
+                    break
         
         # 3. Chercher par le nom de l'entreprise dans l'attribut alt
         if not logo_url and company_name:
             company_lower = company_name.lower()
-            for img in soup.find_all("img"):
-                alt = img.get("alt", "").lower()
-                src = img.get("src", "")
-                
+            for img in soup.select(f"{cdn_img}[alt]"):
+                alt = img["alt"].lower()
                 # Si l'alt contient exactement le nom de l'entreprise (logo)
-                # et c'est une image du CDN (pas une photo d'équipe large)
                 if alt == company_lower or f"{company_lower} logo" in alt:
-                    if "cdn-images.welcometothejungle.com" in src:
-                        logo_url = src
-                        break
+                    logo_url = img["src"]
+                    break
         
         # 4. NOUVEAU: Si pas de logo trouvé, aller chercher sur la page profil de l'entreprise
         if not logo_url:
-            import re
-            match = re.search(r'/companies/([^/]+)', url)
+            match = COMPANY_SLUG_RE.search(url)
             if match:
                 company_slug = match.group(1)
                 lang = "en" if "/en/" in url else "fr"
                 profile_url = f"https://www.welcometothejungle.com/{lang}/companies/{company_slug}"
                 
                 try:
-                    headers = {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    }
-                    response = requests.get(profile_url, headers=headers, timeout=10)
+                    response = get_http_session().get(profile_url, timeout=10)
                     if response.status_code == 200:
-                        profile_soup = BeautifulSoup(response.text, "html.parser")
+                        profile_soup = BeautifulSoup(response.content.decode("utf-8", "replace"), HTML_PARSER)
                         
                         # Chercher le logo dans la page profil
                         # Le logo est généralement une image avec "logo" dans l'URL ou avec alt vide (petite taille)
@@ -247,8 +361,38 @@ def extract_logo_url(soup: BeautifulSoup, url: str, company_name: str = "") -> O
     return logo_url
 
 
+# Couleurs déjà extraites par URL de logo (plusieurs offres d'une même entreprise partagent le logo)
+LOGO_COLORS_CACHE = {}
+LOGO_COLORS_CACHE_SIZE = 256
+
+
+def remember_logo_colors(logo_url: str, colors: dict) -> None:
+    """Mémorise les couleurs d'un logo en mémoire (taille bornée)"""
+    if len(LOGO_COLORS_CACHE) >= LOGO_COLORS_CACHE_SIZE:
+        LOGO_COLORS_CACHE.pop(next(iter(LOGO_COLORS_CACHE)), None)
+    LOGO_COLORS_CACHE[logo_url] = dict(colors)
+
+
+def logo_colors_cache_path(logo_url: str) -> Path:
+    """Fichier de cache des couleurs d'un logo, conservé d'une exécution à l'autre"""
+    return CACHE_DIR / "logos" / f"{hashlib.sha256(logo_url.encode()).hexdigest()}.json"
+
+
 def extract_colors_from_logo(logo_url: str) -> dict:
-    """Extrait les couleurs dominantes du logo"""
+    """Extrait les couleurs dominantes du logo (mémoire, puis cache disque, puis téléchargement)"""
+    cached = LOGO_COLORS_CACHE.get(logo_url)
+    if cached:
+        return dict(cached)
+    
+    if logo_url:
+        try:
+            stored = orjson.loads(logo_colors_cache_path(logo_url).read_bytes())
+            colors = {name: tuple(rgb) for name, rgb in stored.items()}
+            remember_logo_colors(logo_url, colors)
+            return colors
+        except (OSError, orjson.JSONDecodeError):
+            pass
+    
     colors = {
         "primary": (41, 98, 255),      # Bleu par défaut
         "secondary": (255, 193, 7),     # Jaune par défaut
@@ -256,16 +400,14 @@ def extract_colors_from_logo(logo_url: str) -> dict:
         "background": (255, 255, 255)   # Blanc
     }
     
-    if not COLORTHIEF_AVAILABLE or not logo_url:
+    if not logo_url:
         return colors
     
     try:
+        from PIL import Image
+        
         # Télécharger l'image
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
-        }
-        response = requests.get(logo_url, headers=headers, timeout=10, allow_redirects=True)
+        response = get_http_session().get(logo_url, headers=IMAGE_HEADERS, timeout=10)
         response.raise_for_status()
         
         # Vérifier que c'est bien une image
@@ -275,7 +417,6 @@ def extract_colors_from_logo(logo_url: str) -> dict:
             return colors
         
         # Charger l'image avec PIL d'abord pour conversion
-        from PIL import Image
         img_data = io.BytesIO(response.content)
         
         # Convertir en RGB si nécessaire (pour les PNG avec transparence)
@@ -290,21 +431,24 @@ def extract_colors_from_logo(logo_url: str) -> dict:
         elif pil_img.mode != 'RGB':
             pil_img = pil_img.convert('RGB')
         
-        # Sauvegarder en mémoire pour ColorThief
-        img_buffer = io.BytesIO()
-        pil_img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
+        # Réduire l'image : les couleurs dominantes restent les mêmes, avec bien moins de pixels à quantifier
+        pil_img.thumbnail((128, 128), Image.Resampling.LANCZOS)
         
-        # Utiliser ColorThief pour extraire les couleurs
-        color_thief = ColorThief(img_buffer)
+        # Ignorer le fond blanc (comme ColorThief), sauf si le logo est entièrement blanc
+        raw = pil_img.tobytes()
+        pixels = [raw[i:i + 3] for i in range(0, len(raw), 3) if min(raw[i:i + 3]) <= 250]
+        if pixels:
+            pil_img = Image.frombytes('RGB', (len(pixels), 1), b"".join(pixels))
         
-        # Couleur dominante
-        dominant = color_thief.get_color(quality=1)
-        colors["primary"] = dominant
+        # Quantification median cut de Pillow (en C) en 5 couleurs,
+        # triées par nombre de pixels : la première est la couleur dominante
+        quantized = pil_img.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+        palette_rgb = quantized.getpalette()
+        palette = [tuple(palette_rgb[index * 3:index * 3 + 3])
+                   for count, index in sorted(quantized.getcolors(), reverse=True)]
+        colors["primary"] = palette[0]
         
-        # Palette de couleurs (5 couleurs)
         try:
-            palette = color_thief.get_palette(color_count=5, quality=1)
             if len(palette) >= 2:
                 colors["secondary"] = palette[1]
             if len(palette) >= 3:
@@ -319,6 +463,17 @@ def extract_colors_from_logo(logo_url: str) -> dict:
         
         print(f"🎨 Couleurs extraites: Primary={colors['primary']}, Secondary={colors['secondary']}")
         
+        # Seules les extractions réussies sont mémorisées (un échec réseau sera retenté)
+        remember_logo_colors(logo_url, colors)
+        try:
+            cache_path = logo_colors_cache_path(logo_url)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{secrets.token_hex(4)}.tmp")
+            tmp_path.write_bytes(orjson.dumps(colors))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Impossible de mettre les couleurs du logo en cache: {e}")
+        
     except Exception as e:
         print(f"⚠️  Impossible d'extraire les couleurs du logo: {e}")
     
@@ -326,13 +481,23 @@ def extract_colors_from_logo(logo_url: str) -> dict:
 
 
 def translate_profile_to_english(profile: dict) -> dict:
-    """Traduit le profil en anglais via Mistral AI"""
+    """Traduit le profil en anglais via Mistral AI (traductions en cache sur disque)"""
+    
+    # Clé de cache : contenu du profil + modèle utilisé
+    profile_hash = hashlib.sha256(
+        orjson.dumps(profile, option=orjson.OPT_SORT_KEYS, default=str) + MISTRAL_MODEL.encode()
+    ).hexdigest()
+    cache_path = CACHE_DIR / f"{profile_hash}.en.json"
+    try:
+        return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass
     
     if not MISTRAL_AVAILABLE or not MISTRAL_API_KEY:
         print("⚠️  Mistral non disponible, profil non traduit")
         return profile
     
-    client = Mistral(api_key=MISTRAL_API_KEY)
+    client = get_mistral_client()
     
     # Collecter tous les textes à traduire
     texts_to_translate = {
@@ -396,13 +561,12 @@ Return ONLY the translated JSON, no explanation."""
         
         # Nettoyer si nécessaire
         if content.startswith("```"):
-            content = re.sub(r'^```json?\n?', '', content)
-            content = re.sub(r'\n?```$', '', content)
+            content = strip_markdown_fence(content)
         
-        translated = json.loads(content)
+        translated = orjson.loads(content)
         
         # Reconstruire le profil traduit
-        translated_profile = json.loads(json.dumps(profile))  # Deep copy
+        translated_profile = orjson.loads(orjson.dumps(profile))  # Copie profonde
         
         if "introduction" in translated:
             translated_profile["introduction"] = translated["introduction"]
@@ -451,6 +615,16 @@ Return ONLY the translated JSON, no explanation."""
             translated_profile["interests"] = translated["interests"].split(" ||| ")
         
         print("🌐 Profil traduit en anglais")
+        
+        # Écriture atomique du cache (ignorée si le disque est en lecture seule)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{secrets.token_hex(4)}.tmp")
+            tmp_path.write_bytes(orjson.dumps(translated_profile))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Impossible de mettre la traduction en cache: {e}")
+        
         return translated_profile
         
     except Exception as e:
@@ -458,6 +632,12 @@ Return ONLY the translated JSON, no explanation."""
         return profile
 
 
+def mistral_cache_path(prompt: str) -> Path:
+    """Fichier de cache d'une réponse Mistral pour un prompt donné"""
+    key = hashlib.sha256(prompt.encode() + MISTRAL_MODEL.encode()).hexdigest()
+    return CACHE_DIR / "mistral" / f"{key}.json"
+
+
 def generate_cover_with_mistral(profile: dict, job_data: dict, job_context: dict) -> dict:
     """Utilise Mistral AI pour générer une lettre de motivation personnalisée"""
     
@@ -465,8 +645,6 @@ def generate_cover_with_mistral(profile: dict, job_data: dict, job_context: dict
         print("⚠️  Mistral non disponible, utilisation du template par défaut")
         return None
     
-    client = Mistral(api_key=MISTRAL_API_KEY)
-    
     # Langue de l'offre
     lang = job_data.get("language", "fr")
     lang_instruction = {
@@ -488,20 +666,30 @@ def generate_cover_with_mistral(profile: dict, job_data: dict, job_context: dict
         exp_text += f"- {exp['title']} chez {exp['company']} ({exp['period']}): {'; '.join(exp['bullets'][:2])}\n"
     
     # Compétences PERTINENTES pour l'offre (pas toutes les compétences)
-    job_text = job_data.get("raw_text", "").lower()
-    relevant_skills = []
-    for skill_id, skill_data in profile.get("skills", {}).items():
+    # Items du profil découpés en mots comme le texte de l'offre
+    # ("Google Cloud Platform (GCP)" -> "google cloud platform gcp")
+    profile_items = []
+    for skill_data in profile.get("skills", {}).values():
         for item in skill_data.get("items", []):
             item_lower = item.lower()
-            # L'item matche un mot-clé de l'offre
-            if item_lower in [kw.lower() for kw in job_keywords]:
-                relevant_skills.append(item)
-            # L'item est mentionné dans le texte de l'offre
-            elif item_lower in job_text:
-                relevant_skills.append(item)
-    
-    # Dédupliquer
-    relevant_skills = list(dict.fromkeys(relevant_skills))[:12]
+            profile_items.append((item, item_lower, skill_ngram_keys(item_lower)))
+    # Texte de l'offre découpé une seule fois en n-grammes : recherche O(1) par compétence,
+    # sans faux positifs du type "rust" dans "trust"
+    max_n = max((keys[1].count(" ") + 1 for _, _, keys in profile_items), default=1)
+    job_ngrams = text_ngrams(job_data.get("raw_text", ""), max_n)
+    job_keywords_set = {kw.lower() for kw in job_keywords}
+    # Dédupliquées au fil de l'eau, 12 au maximum
+    relevant_skills = []
+    seen_skills = set()
+    for item, item_lower, keys in profile_items:
+        if item in seen_skills:
+            continue
+        # L'item matche un mot-clé de l'offre ou est mentionné dans le texte de l'offre
+        if item_lower in job_keywords_set or not job_ngrams.isdisjoint(keys):
+            seen_skills.add(item)
+            relevant_skills.append(item)
+            if len(relevant_skills) == 12:
+                break
     
     # Si pas assez, ajouter les top compétences
     if len(relevant_skills) < 5:
@@ -567,6 +755,17 @@ FORMAT DE RÉPONSE (JSON):
 
 Réponds UNIQUEMENT avec le JSON, sans markdown ni explication."""
 
+    # Clé de cache : prompt complet (profil, offre, compétences retenues) + modèle utilisé
+    cache_path = mistral_cache_path(prompt)
+    try:
+        result = orjson.loads(cache_path.read_bytes())
+        print("✨ Lettre Mistral AI reprise du cache")
+        return result
+    except (OSError, orjson.JSONDecodeError):
+        pass
+    
+    client = get_mistral_client()
+    
     try:
         response = client.chat.complete(
             model=MISTRAL_MODEL,
@@ -578,11 +777,20 @@ Réponds UNIQUEMENT avec le JSON, sans markdown ni explication."""
         # Parser le JSON
         # Nettoyer si nécessaire (enlever les backticks markdown)
         if content.startswith("```"):
-            content = re.sub(r'^```json?\n?', '', content)
-            content = re.sub(r'\n?```$', '', content)
+            content = strip_markdown_fence(content)
         
-        result = json.loads(content)
+        result = orjson.loads(content)
         print("✨ Lettre générée par Mistral AI")
+        
+        # Écriture atomique du cache (ignorée si le disque est en lecture seule)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{secrets.token_hex(4)}.tmp")
+            tmp_path.write_bytes(orjson.dumps(result))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Impossible de mettre la lettre en cache: {e}")
+        
         return result
         
     except Exception as e:
@@ -592,24 +800,105 @@ Réponds UNIQUEMENT avec le JSON, sans markdown ni explication."""
 
 def load_profile() -> dict:
     """Charge le profil personnel depuis profile.json"""
-    with open(PROFILE_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(PROFILE_PATH.read_bytes())
+
+
+def offer_cache_path(url: str) -> Path:
+    """Fichier de cache d'une offre déjà analysée"""
+    return CACHE_DIR / "offers" / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def load_cached_offer(url: str) -> Optional[dict]:
+    """Renvoie l'offre analysée il y a moins de OFFER_CACHE_TTL secondes, sinon None"""
+    cache_path = offer_cache_path(url)
+    try:
+        if time.time() - cache_path.stat().st_mtime < OFFER_CACHE_TTL:
+            return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass
+    return None
+
+
+def save_cached_offer(url: str, job_data: dict) -> None:
+    """Met en cache une offre analysée (écriture atomique, ignorée en cas d'erreur disque)"""
+    if not job_data.get("title"):
+        return
+    cache_path = offer_cache_path(url)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{secrets.token_hex(4)}.tmp")
+        tmp_path.write_bytes(orjson.dumps(job_data, default=str))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️  Impossible de mettre l'offre en cache: {e}")
 
 
 def fetch_job_offer(url: str) -> dict:
-    """Récupère et parse l'offre d'emploi depuis l'URL"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+    """Récupère et parse l'offre d'emploi depuis l'URL (ou depuis le cache)
+    
+    Hors cache, les couleurs du logo ne sont pas extraites : main() s'en charge
+    en parallèle de la traduction du profil, puis met l'offre en cache.
+    """
+    cached = load_cached_offer(url)
+    if cached:
+        print("📦 Offre chargée depuis le cache")
+        return cached
+    
+    import requests
     
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = get_http_session().get(url, timeout=15)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"❌ Erreur lors de la récupération de l'offre: {e}")
         sys.exit(1)
     
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Octets bruts : pas de détection d'encodage par requests quand l'en-tête n'a pas de charset
+    return parse_job_offer(url, response.content, with_colors=False)
+
+
+def priority_selectors(*selectors: str) -> tuple:
+    """Compile une liste de sélecteurs CSS par ordre de priorité, plus leur union"""
+    return soupsieve.compile(", ".join(selectors)), tuple(soupsieve.compile(s) for s in selectors)
+
+
+def select_by_priority(soup: BeautifulSoup, selectors: tuple):
+    """Éléments correspondant aux sélecteurs, dans leur ordre de priorité, en un seul parcours du DOM"""
+    union, ordered = selectors
+    matches = union.select(soup)
+    for selector in ordered:
+        for elem in matches:
+            if selector.match(elem):
+                yield elem
+
+
+# Sélecteurs génériques (hors WTTJ), du plus spécifique au plus large
+TITLE_SELECTORS = priority_selectors(
+    "h1",
+    "[data-testid='job-title']",
+    ".job-title",
+    ".offer-title",
+    "[class*='title']"
+)
+COMPANY_SELECTORS = priority_selectors(
+    "[data-testid='company-name']",
+    ".company-name",
+    "[class*='company']",
+    "meta[property='og:site_name']"
+)
+CONTENT_SELECTORS = priority_selectors(
+    "[data-testid='job-section-description']",
+    ".job-description",
+    ".offer-description",
+    "article",
+    "main",
+    "[class*='description']"
+)
+
+
+def parse_job_offer(url: str, html: bytes, with_colors: bool = True) -> dict:
+    """Parse l'offre d'emploi à partir du HTML brut (UTF-8) de la page"""
+    soup = BeautifulSoup(html, HTML_PARSER, from_encoding="utf-8")
     
     # Extraction générique - fonctionne pour la plupart des sites
     job_data = {
@@ -625,17 +914,14 @@ def fetch_job_offer(url: str) -> dict:
     
     # Détection spéciale Welcome to the Jungle
     if "welcometothejungle" in url:
-        import re
-        import json as json_module
-        
         # Extraire depuis l'URL: /companies/{company}/jobs/{job-title}_{city}_{COMPANY}_{id}
-        match = re.search(r'/companies/([^/]+)/jobs/([^/?]+)', url)
+        match = WTTJ_JOB_PATH_RE.search(url)
         if match:
             job_data["company"] = match.group(1).replace('-', ' ').title()
             raw_slug = match.group(2)
             
             # Enlever le suffixe ID (format: _COMPANY_RandomId comme _THALE_DxLJy4A)
-            raw_slug = re.sub(r'_[A-Z]{2,}_[A-Za-z0-9]+$', '', raw_slug)
+            raw_slug = WTTJ_ID_SUFFIX_RE.sub('', raw_slug)
             
             # Séparer par underscore : format typique {job-title}_{city}
             parts = raw_slug.split('_')
@@ -646,13 +932,13 @@ def fetch_job_offer(url: str) -> dict:
                 job_data["location"] = potential_city.title()
         
         # Extraire les données JSON de window.__INITIAL_DATA__ (WTTJ utilise du JS)
-        json_match = re.search(r'window\.__INITIAL_DATA__\s*=\s*"(.+?)"(?:\s|;)', response.text)
+        json_match = WTTJ_INITIAL_DATA_RE.search(html)
         if json_match:
             try:
-                escaped_json = json_match.group(1)
+                escaped_json = json_match.group(1).decode("utf-8", "replace")
                 # Decode the escaped JSON string
-                decoded = json_module.loads('"' + escaped_json + '"')
-                parsed_data = json_module.loads(decoded)
+                decoded = orjson.loads('"' + escaped_json + '"')
+                parsed_data = orjson.loads(decoded)
                 
                 # Chercher les données du job dans queries
                 for query in parsed_data.get('queries', []):
@@ -661,23 +947,17 @@ def fetch_job_offer(url: str) -> dict:
                     if 'name' in data:
                         # Titre du poste
                         raw_title = data.get('name', '')
-                        # Nettoyer le titre
-                        raw_title = re.sub(r'\s*[-–—]\s+.*$', '', raw_title)
-                        raw_title = re.sub(r'\s*[\(\[]\s*[xXhHfFmM]\s*/?\s*[xXhHfFmM]\s*/?\s*[xXhHfFmM]?\s*[\)\]]?\s*$', '', raw_title)
-                        raw_title = re.sub(r'\s+[HhFf]\s*/?\s*[HhFf]\s*$', '', raw_title)
-                        job_data["title"] = raw_title.strip()
+                        job_data["title"] = clean_job_title(raw_title)
                         
                         # Description (enlever HTML)
                         description = data.get('description', '')
                         if description:
-                            desc_soup = BeautifulSoup(description, 'html.parser')
-                            job_data["description"] = desc_soup.get_text(separator='\n', strip=True)
+                            job_data["description"] = html_fragment_to_text(description)
                         
                         # Profil recherché
                         profile = data.get('profile', '')
                         if profile:
-                            profile_soup = BeautifulSoup(profile, 'html.parser')
-                            job_data["requirements"] = [li.get_text(strip=True) for li in profile_soup.find_all('li')]
+                            job_data["requirements"] = html_list_items(profile)
                         
                         # Location depuis offices
                         offices = data.get('offices', [])
@@ -700,70 +980,41 @@ def fetch_job_offer(url: str) -> dict:
         if not job_data["title"]:
             title_elem = soup.select_one("h1")
             if title_elem:
-                html_title = title_elem.get_text(strip=True)
-                html_title = re.sub(r'\s*[-–—]\s+.*$', '', html_title)
-                html_title = re.sub(r'\s*[\(\[]\s*[xXhHfFmM]\s*/?\s*[xXhHfFmM]\s*/?\s*[xXhHfFmM]?\s*[\)\]]?\s*$', '', html_title)
-                html_title = re.sub(r'\s+[HhFf]\s*/?\s*[HhFf]\s*$', '', html_title)
-                job_data["title"] = html_title.strip()
+                job_data["title"] = clean_job_title(title_elem.get_text(strip=True))
     
     # Titre du poste (si pas déjà trouvé)
     if not job_data["title"]:
-        title_selectors = [
-            "h1", 
-            "[data-testid='job-title']",
-            ".job-title",
-            ".offer-title",
-            "[class*='title']"
-        ]
-        for selector in title_selectors:
-            elem = soup.select_one(selector)
-            if elem and elem.get_text(strip=True):
+        for elem in select_by_priority(soup, TITLE_SELECTORS):
+            if elem.get_text(strip=True):
                 job_data["title"] = elem.get_text(strip=True)
                 break
     
     # Nom de l'entreprise (si pas déjà trouvé)
     if not job_data["company"]:
-        company_selectors = [
-            "[data-testid='company-name']",
-            ".company-name",
-            "[class*='company']",
-            "meta[property='og:site_name']"
-        ]
-        for selector in company_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                job_data["company"] = elem.get("content") if elem.name == "meta" else elem.get_text(strip=True)
-                if job_data["company"]:
-                    break
+        for elem in select_by_priority(soup, COMPANY_SELECTORS):
+            job_data["company"] = elem.get("content") if elem.name == "meta" else elem.get_text(strip=True)
+            if job_data["company"]:
+                break
     
     # Description complète
-    content_selectors = [
-        "[data-testid='job-section-description']",
-        ".job-description",
-        ".offer-description",
-        "article",
-        "main",
-        "[class*='description']"
-    ]
-    for selector in content_selectors:
-        elem = soup.select_one(selector)
-        if elem:
-            job_data["description"] = elem.get_text(separator="\n", strip=True)
-            break
+    elem = next(select_by_priority(soup, CONTENT_SELECTORS), None)
+    if elem:
+        job_data["description"] = elem.get_text(separator="\n", strip=True)
     
-    # Texte brut de toute la page pour l'analyse
+    # Texte brut de toute la page pour l'analyse, stocké une fois pour toutes en minuscules
     job_data["raw_text"] = soup.get_text(separator=" ", strip=True).lower()
     
     # Extraction des mots-clés techniques
     job_data["keywords"] = extract_keywords(job_data["raw_text"])
     
-    # Extraction du logo de l'entreprise
-    job_data["logo_url"] = extract_logo_url(soup, url, job_data.get("company", ""))
+    # Extraction du logo de l'entreprise (déjà connu si WTTJ l'a fourni dans __INITIAL_DATA__)
+    job_data["logo_url"] = job_data.get("logo_url") or extract_logo_url(soup, url, job_data.get("company", ""))
     if job_data["logo_url"]:
         print(f"🖼️  Logo trouvé: {job_data['logo_url'][:80]}...")
     
     # Extraction des couleurs du logo
-    job_data["colors"] = extract_colors_from_logo(job_data["logo_url"])
+    if with_colors:
+        job_data["colors"] = extract_colors_from_logo(job_data["logo_url"])
     
     # Détection de la langue de l'offre
     job_data["language"] = detect_offer_language(job_data.get("description", "") or job_data.get("raw_text", ""))
@@ -773,55 +1024,93 @@ def fetch_job_offer(url: str) -> dict:
     return job_data
 
 
-def extract_keywords(text: str) -> list:
-    """Extrait les mots-clés techniques du texte de l'offre"""
-    text_lower = text.lower()
-    
-    # Liste de mots-clés techniques à détecter
-    tech_keywords = {
-        # Cloud
-        "gcp", "google cloud", "aws", "azure", "cloud", "kubernetes", "docker", "terraform",
-        # Data Engineering
-        "bigquery", "big query", "airflow", "kafka", "spark", "hadoop", "dataflow", "pub/sub",
-        "etl", "elt", "pipeline", "data pipeline", "dbt", "fivetran", "airbyte",
-        # Databases
-        "sql", "nosql", "postgresql", "postgres", "mysql", "mongodb", "redis", "elasticsearch",
-        "snowflake", "redshift", "databricks",
-        # Programming
-        "python", "java", "scala", "go", "golang", "bash", "shell", "r",
-        # ML/AI
-        "machine learning", "deep learning", "nlp", "tensorflow", "pytorch", "scikit-learn",
-        "hugging face", "bert", "llm", "ia", "ai", "vertex ai", "mlops",
-        # BI/Viz
-        "power bi", "tableau", "looker", "lookml", "metabase", "data visualization", "dashboard",
-        "semantic layer", "bi", "reporting",
-        # Methodologies
-        "agile", "scrum", "devops", "ci/cd", "git",
-        # Data Governance
-        "data quality", "data governance", "gouvernance", "qualité des données", "rgpd", "gdpr",
-        "data catalog", "metadata", "lineage",
-        # Soft skills
-        "anglais", "english", "communication", "équipe", "team"
-    }
-    
-    found = []
-    for kw in tech_keywords:
-        if kw in text_lower:
-            found.append(kw)
-    
-    return list(set(found))
-
-
-def match_score(item_keywords: list, job_keywords: list) -> int:
-    """Calcule un score de correspondance entre deux listes de mots-clés"""
-    item_set = set(k.lower() for k in item_keywords)
-    job_set = set(k.lower() for k in job_keywords)
-    return len(item_set & job_set)
+# Mots-clés techniques détectés dans les offres
+TECH_KEYWORDS = frozenset({
+    # Cloud
+    "gcp", "google cloud", "aws", "azure", "cloud", "kubernetes", "docker", "terraform",
+    # Data Engineering
+    "bigquery", "big query", "airflow", "kafka", "spark", "hadoop", "dataflow", "pub/sub",
+    "etl", "elt", "pipeline", "data pipeline", "dbt", "fivetran", "airbyte",
+    # Databases
+    "sql", "nosql", "postgresql", "postgres", "mysql", "mongodb", "redis", "elasticsearch",
+    "snowflake", "redshift", "databricks",
+    # Programming
+    "python", "java", "scala", "go", "golang", "bash", "shell", "r",
+    # ML/AI
+    "machine learning", "deep learning", "nlp", "tensorflow", "pytorch", "scikit-learn",
+    "hugging face", "bert", "llm", "ia", "ai", "vertex ai", "mlops",
+    # BI/Viz
+    "power bi", "tableau", "looker", "lookml", "metabase", "data visualization", "dashboard",
+    "semantic layer", "bi", "reporting",
+    # Methodologies
+    "agile", "scrum", "devops", "ci/cd", "git",
+    # Data Governance
+    "data quality", "data governance", "gouvernance", "qualité des données", "rgpd", "gdpr",
+    "data catalog", "metadata", "lineage",
+    # Soft skills
+    "anglais", "english", "communication", "équipe", "team"
+})
+
+
+def extract_keywords(text_lower: str) -> list:
+    """Extrait les mots-clés techniques du texte de l'offre (déjà en minuscules)"""
+    # Recherche de sous-chaîne volontaire ("go" dans "google" compte) : `in` reste plus
+    # rapide qu'une alternance regex sur ~80 mots-clés
+    return [kw for kw in TECH_KEYWORDS if kw in text_lower]
+
+
+def keyword_set(item: dict) -> frozenset:
+    """Mots-clés en minuscules d'un élément du profil (expérience, compétence, certification)
+    
+    Les chaînes sont internées, comme celles de l'offre dans adapt_profile : les intersections
+    de match_score comparent alors des pointeurs plutôt que des caractères.
+    """
+    return frozenset(sys.intern(k.lower()) for k in item.get("keywords", []))
+
+
+def match_score(item_keywords: frozenset, job_keywords_set: frozenset) -> int:
+    """Calcule un score de correspondance entre les mots-clés d'un élément du profil et ceux de l'offre"""
+    return len(item_keywords & job_keywords_set)
+
+
+# Mots-clés de l'offre comptés pour choisir le profil type (titre et résumé)
+TITLE_KEYWORDS = {
+    "data_engineer": ("etl", "elt", "pipeline", "airflow", "gcp", "bigquery", "data engineer",
+                      "dbt", "terraform", "kafka", "spark", "dataflow", "orchestration",
+                      "cloud", "aws", "azure", "infrastructure"),
+    "data_scientist": ("machine learning", "ml", "model", "nlp", "deep learning", "data scientist",
+                       "tensorflow", "pytorch", "scikit", "prediction", "classification"),
+    "data_steward": ("governance", "gouvernance", "quality", "qualité", "steward", "catalog",
+                     "metadata", "lineage", "compliance"),
+    "data_analyst": ("analyst", "bi", "power bi", "tableau", "dashboard", "reporting",
+                     "excel", "business intelligence"),
+}
+
+# Phrase de spécialisation selon le profil détecté - versions FR et EN
+SPECIALIZATION_PHRASES_FR = {
+    "data_engineer": "Passionné par l'industrialisation des flux de données, l'optimisation des pipelines et l'infrastructure cloud.",
+    "data_scientist": "Passionné par le Machine Learning et l'IA, avec une expertise en déploiement de modèles et analyse prédictive.",
+    "data_steward": "Expert en gouvernance des données, catalogage et qualité des données, avec une forte capacité de collaboration transverse.",
+    "data_analyst": "Passionné par la visualisation de données et le reporting, avec une maîtrise des outils BI modernes.",
+    "default": ""
+}
+
+SPECIALIZATION_PHRASES_EN = {
+    "data_engineer": "Passionate about industrializing data flows, optimizing pipelines, and cloud infrastructure.",
+    "data_scientist": "Passionate about Machine Learning and AI, with expertise in model deployment and predictive analytics.",
+    "data_steward": "Expert in data governance, cataloging, and data quality, with strong cross-functional collaboration skills.",
+    "data_analyst": "Passionate about data visualization and reporting, with mastery of modern BI tools.",
+    "default": ""
+}
+
+# Un titre d'offre contenant l'un de ces mots est repris tel quel sur le CV
+DATA_TITLE_MARKERS = ("data", "engineer", "scientist", "analyst", "bi", "ml")
 
 
 def adapt_profile(profile: dict, job_data: dict) -> dict:
     """Adapte le profil en fonction de l'offre d'emploi"""
     job_keywords = job_data["keywords"]
+    job_keywords_set = frozenset(sys.intern(kw.lower()) for kw in job_keywords)
     job_text = job_data["raw_text"]
     
     adapted = {
@@ -833,15 +1122,8 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
     
     # Déterminer le meilleur titre/résumé
     title_scores = {
-        "data_engineer": sum(1 for kw in ["etl", "elt", "pipeline", "airflow", "gcp", "bigquery", "data engineer", 
-                                          "dbt", "terraform", "kafka", "spark", "dataflow", "orchestration",
-                                          "cloud", "aws", "azure", "infrastructure"] if kw in job_text),
-        "data_scientist": sum(1 for kw in ["machine learning", "ml", "model", "nlp", "deep learning", "data scientist",
-                                           "tensorflow", "pytorch", "scikit", "prediction", "classification"] if kw in job_text),
-        "data_steward": sum(1 for kw in ["governance", "gouvernance", "quality", "qualité", "steward", "catalog",
-                                         "metadata", "lineage", "compliance"] if kw in job_text),
-        "data_analyst": sum(1 for kw in ["analyst", "bi", "power bi", "tableau", "dashboard", "reporting",
-                                         "excel", "business intelligence"] if kw in job_text)
+        profile_type: sum(1 for kw in keywords if kw in job_text)
+        for profile_type, keywords in TITLE_KEYWORDS.items()
     }
     best_profile = max(title_scores, key=title_scores.get)
     
@@ -857,31 +1139,14 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
         "particularly in data governance and data engineering, I am seeking a new "
         "opportunity to apply my acquired experiences and knowledge, in order to take on new challenges.")
     
-    # Phrase de spécialisation selon le profil détecté - versions FR et EN
-    specialization_phrases_fr = {
-        "data_engineer": "Passionné par l'industrialisation des flux de données, l'optimisation des pipelines et l'infrastructure cloud.",
-        "data_scientist": "Passionné par le Machine Learning et l'IA, avec une expertise en déploiement de modèles et analyse prédictive.",
-        "data_steward": "Expert en gouvernance des données, catalogage et qualité des données, avec une forte capacité de collaboration transverse.",
-        "data_analyst": "Passionné par la visualisation de données et le reporting, avec une maîtrise des outils BI modernes.",
-        "default": ""
-    }
-    
-    specialization_phrases_en = {
-        "data_engineer": "Passionate about industrializing data flows, optimizing pipelines, and cloud infrastructure.",
-        "data_scientist": "Passionate about Machine Learning and AI, with expertise in model deployment and predictive analytics.",
-        "data_steward": "Expert in data governance, cataloging, and data quality, with strong cross-functional collaboration skills.",
-        "data_analyst": "Passionate about data visualization and reporting, with mastery of modern BI tools.",
-        "default": ""
-    }
-    
     # Choisir la langue selon l'offre
     lang = job_data.get("language", "fr")
     if lang == "en":
         base_intro = base_intro_en
-        specialization = specialization_phrases_en.get(best_profile, "")
+        specialization = SPECIALIZATION_PHRASES_EN.get(best_profile, "")
     else:
         base_intro = base_intro_fr
-        specialization = specialization_phrases_fr.get(best_profile, "")
+        specialization = SPECIALIZATION_PHRASES_FR.get(best_profile, "")
     
     # Construire le résumé complet
     if specialization:
@@ -893,7 +1158,7 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
     if job_data["title"]:
         # Nettoyer et utiliser le titre de l'offre si c'est un titre data
         title_lower = job_data["title"].lower()
-        if any(kw in title_lower for kw in ["data", "engineer", "scientist", "analyst", "bi", "ml"]):
+        if any(kw in title_lower for kw in DATA_TITLE_MARKERS):
             adapted["display_title"] = job_data["title"].split(" - ")[0].split(" (")[0].strip()
         else:
             adapted["display_title"] = profile["titles"][0]
@@ -903,7 +1168,7 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
     # Trier les expériences par pertinence
     experiences = []
     for exp in profile["experiences"]:
-        score = match_score(exp["keywords"], job_keywords)
+        score = match_score(keyword_set(exp), job_keywords_set)
         # Sélectionner les bullets les plus pertinentes (max 4)
         selected_bullets = exp["bullets"][:4]
         experiences.append({
@@ -915,9 +1180,12 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
     adapted["experiences"] = experiences
     
     # Trier les compétences par pertinence
+    # Formes normalisées des mots-clés et du texte, calculées une fois pour tous les items
+    job_keywords_clean = {kw.replace(" ", "").replace("-", "") for kw in job_keywords_set}
+    job_text_nospace = job_text.replace(" ", "")
     skills = []
     for skill_id, skill_data in profile["skills"].items():
-        score = match_score(skill_data["keywords"], job_keywords)
+        score = match_score(keyword_set(skill_data), job_keywords_set)
         # Filtrer les items pertinents - matching amélioré
         # Priorité 1: items qui matchent exactement un mot-clé de l'offre
         exact_match = []
@@ -931,13 +1199,13 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
             item_clean = item_lower.replace(" ", "").replace("-", "")
             
             # Vérifier si c'est un match exact avec un mot-clé détecté
-            if item_lower in job_keywords or item_clean in [k.replace(" ", "").replace("-", "") for k in job_keywords]:
+            if item_lower in job_keywords_set or item_clean in job_keywords_clean:
                 exact_match.append(item)
             # Vérifier si l'item est mentionné dans le texte de l'offre
-            elif item_lower in job_text or item_clean in job_text.replace(" ", ""):
+            elif item_lower in job_text or item_clean in job_text_nospace:
                 text_match.append(item)
             # Vérifier si un mot-clé est contenu dans l'item
-            elif any(kw.lower() in item_lower for kw in job_keywords):
+            elif any(kw in item_lower for kw in job_keywords_set):
                 text_match.append(item)
             else:
                 other_items.append(item)
@@ -962,7 +1230,7 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
     # Filtrer les certifications pertinentes
     certifications = []
     for cert in profile["certifications"]:
-        score = match_score(cert["keywords"], job_keywords)
+        score = match_score(keyword_set(cert), job_keywords_set)
         certifications.append({**cert, "score": score})
     certifications.sort(key=lambda x: -x["score"])
     adapted["certifications"] = certifications[:5]  # Top 5
@@ -992,22 +1260,49 @@ def adapt_profile(profile: dict, job_data: dict) -> dict:
     return adapted
 
 
+# Table de traduction des caractères spéciaux LaTeX (une seule passe avec str.translate)
+LATEX_ESCAPES = str.maketrans({
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}"
+})
+
+
+@lru_cache(maxsize=4096)
 def escape_latex(text: str) -> str:
-    """Échappe les caractères spéciaux LaTeX"""
-    replacements = {
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "{": r"\{",
-        "}": r"\}",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}"
+    """Échappe les caractères spéciaux LaTeX (mémoïsé : les textes du profil reviennent à chaque document)"""
+    return text.translate(LATEX_ESCAPES)
+
+
+# Traductions des sections du CV
+CV_TRANSLATIONS = {
+    "fr": {
+        "experiences": "EXPÉRIENCES",
+        "education": "FORMATIONS",
+        "skills": "COMPÉTENCES",
+        "projects": "PROJETS PERSONNELS",
+        "certifications": "CERTIFICATIONS",
+        "languages": "LANGUES",
+        "interests": "CENTRES D'INTÉRÊT",
+        "babel": "french"
+    },
+    "en": {
+        "experiences": "EXPERIENCE",
+        "education": "EDUCATION",
+        "skills": "SKILLS",
+        "projects": "PERSONAL PROJECTS",
+        "certifications": "CERTIFICATIONS",
+        "languages": "LANGUAGES",
+        "interests": "INTERESTS",
+        "babel": "english"
     }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+}
 
 
 def generate_cv(adapted: dict, output_path: Path) -> None:
@@ -1016,37 +1311,14 @@ def generate_cv(adapted: dict, output_path: Path) -> None:
     # Langue de l'offre
     lang = adapted.get("language", "fr")
     
-    # Traductions des sections
-    translations = {
-        "fr": {
-            "experiences": "EXPÉRIENCES",
-            "education": "FORMATIONS",
-            "skills": "COMPÉTENCES",
-            "projects": "PROJETS PERSONNELS",
-            "certifications": "CERTIFICATIONS",
-            "languages": "LANGUES",
-            "interests": "CENTRES D'INTÉRÊT",
-            "babel": "french"
-        },
-        "en": {
-            "experiences": "EXPERIENCE",
-            "education": "EDUCATION",
-            "skills": "SKILLS",
-            "projects": "PERSONAL PROJECTS",
-            "certifications": "CERTIFICATIONS",
-            "languages": "LANGUAGES",
-            "interests": "INTERESTS",
-            "babel": "english"
-        }
-    }
-    t = translations.get(lang, translations["fr"])
+    t = CV_TRANSLATIONS.get(lang, CV_TRANSLATIONS["fr"])
     
-    # Générer les sections
-    experiences_tex = ""
+    # Générer les sections (morceaux assemblés avec "".join, pas de += sur une chaîne qui grossit)
+    experiences_parts = []
     for exp in adapted["experiences"]:
         bullets = "\n".join(f"    \\item {escape_latex(b)}" for b in exp["selected_bullets"])
         if bullets:
-            experiences_tex += f"""\\cventry{{{escape_latex(exp['title'])}}}
+            experiences_parts.append(f"""\\cventry{{{escape_latex(exp['title'])}}}
 {{{escape_latex(exp['company'])}}}
 {{{exp['period']}}}
 {{%
@@ -1055,47 +1327,44 @@ def generate_cv(adapted: dict, output_path: Path) -> None:
 \\end{{itemize}}
 }}
 
-"""
+""")
         else:
-            experiences_tex += f"""\\cventry{{{escape_latex(exp['title'])}}}
+            experiences_parts.append(f"""\\cventry{{{escape_latex(exp['title'])}}}
 {{{escape_latex(exp['company'])}}}
 {{{exp['period']}}}
 {{}}
 
-"""
+""")
+    experiences_tex = "".join(experiences_parts)
     
-    education_tex = ""
-    for edu in adapted["education"]:
-        education_tex += f"""\\cventry{{{escape_latex(edu['title'])}}}
+    education_tex = "".join(f"""\\cventry{{{escape_latex(edu['title'])}}}
 {{{escape_latex(edu['school'])}}}
 {{{edu['period']}}}
 {{}}
 
-"""
+""" for edu in adapted["education"])
     
-    skills_tex = ""
-    for skill in adapted["skills"]:
-        items = ", ".join(skill["items"])
-        skills_tex += f"\\competence{{{escape_latex(skill['label'])}}}{{{escape_latex(items)}}}\n"
+    skills_tex = "".join(
+        f"\\competence{{{escape_latex(skill['label'])}}}{{{escape_latex(', '.join(skill['items']))}}}\n"
+        for skill in adapted["skills"]
+    )
     
-    certifications_tex = ""
-    for cert in adapted["certifications"]:
-        certifications_tex += f"\\certification{{{escape_latex(cert['name'])} ({cert['date']})}}\n"
+    certifications_tex = "".join(
+        f"\\certification{{{escape_latex(cert['name'])} ({cert['date']})}}\n"
+        for cert in adapted["certifications"]
+    )
     
-    languages_tex = ""
-    for lang in adapted["languages"]:
-        languages_tex += f"\\certification{{\\small {escape_latex(lang['name'])} - {escape_latex(lang['level'])}}}\n"
+    languages_tex = "".join(
+        f"\\certification{{\\small {escape_latex(language['name'])} - {escape_latex(language['level'])}}}\n"
+        for language in adapted["languages"]
+    )
     
-    interests_tex = ""
-    for interest in adapted["interests"]:
-        interests_tex += f"\\certification{{\\small {interest}}}\n"
+    interests_tex = "".join(f"\\certification{{\\small {interest}}}\n" for interest in adapted["interests"])
     
     # Projects section
-    projects_tex = ""
-    for proj in adapted.get("projects", []):
-        projects_tex += f"""\\noindent\\textbf{{{escape_latex(proj['name'])}}} \\hfill \\textcolor{{textgray}}{{\\small {escape_latex(proj.get('technologies', ''))}}}\\\\
+    projects_tex = "".join(f"""\\noindent\\textbf{{{escape_latex(proj['name'])}}} \\hfill \\textcolor{{textgray}}{{\\small {escape_latex(proj.get('technologies', ''))}}}\\\\
 {{\\small {escape_latex(proj['description'])}}}\\\\[4pt]
-"""
+""" for proj in adapted.get("projects", []))
     
     # Template CV
     cv_content = f"""\\documentclass[a4paper,10pt]{{article}}
@@ -1223,16 +1492,38 @@ def generate_cv(adapted: dict, output_path: Path) -> None:
 \\end{{document}}
 """
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(cv_content)
+    write_text_atomic(output_path, cv_content)
     
     print(f"✅ CV généré: {output_path}")
 
 
+# Indices du type d'entreprise et de la politique de télétravail
+STARTUP_MARKERS = ("startup", "early stage", "seed", "série a")
+SCALEUP_MARKERS = ("scale-up", "scaleup", "série b", "série c", "hyper-croissance", "forte croissance")
+LARGE_GROUP_MARKERS = ("groupe", "filiale", "cac 40", "grand compte", "leader mondial")
+FULL_REMOTE_MARKERS = ("full remote", "100% remote", "télétravail total")
+HYBRID_REMOTE_MARKERS = ("télétravail", "remote", "hybride")
+
+# Stack technique relevée dans l'offre pour la lettre (ordre d'affichage)
+CONTEXT_TECH_KEYWORDS = ("bigquery", "snowflake", "databricks", "airflow", "dbt", "spark",
+                         "kafka", "python", "sql", "terraform", "docker", "kubernetes",
+                         "aws", "gcp", "azure", "looker", "tableau", "power bi", "dataflow")
+
+# Valeurs d'entreprise et les mots qui les trahissent dans l'offre
+VALUE_KEYWORDS = {
+    "innovation": ("innovation", "innover", "disruption", "révolutionne"),
+    "collaboration": ("collaboration", "équipe", "ensemble", "collectif"),
+    "excellence": ("excellence", "exigence", "qualité", "rigueur"),
+    "impact": ("impact", "différence", "transformation", "changer"),
+    "croissance": ("croissance", "ambition", "scale", "développement"),
+    "bienveillance": ("bienveillance", "humain", "bien-être", "care")
+}
+
+
 def analyze_job_context(job_data: dict) -> dict:
     """Analyse le contexte de l'offre pour personnaliser la lettre"""
-    description = job_data.get("description", "").lower()
-    raw_text = job_data.get("raw_text", "").lower()
+    # raw_text est déjà en minuscules (parse_job_offer), comme pour adapt_profile
+    raw_text = job_data.get("raw_text", "")
     
     context = {
         "company_type": "entreprise",  # startup, scale-up, grand groupe
@@ -1247,13 +1538,13 @@ def analyze_job_context(job_data: dict) -> dict:
     }
     
     # Détecter le type d'entreprise
-    if any(w in raw_text for w in ["startup", "early stage", "seed", "série a"]):
+    if any(w in raw_text for w in STARTUP_MARKERS):
         context["company_type"] = "startup"
         context["tone"] = "casual"
-    elif any(w in raw_text for w in ["scale-up", "scaleup", "série b", "série c", "hyper-croissance", "forte croissance"]):
+    elif any(w in raw_text for w in SCALEUP_MARKERS):
         context["company_type"] = "scale-up"
         context["tone"] = "casual"
-    elif any(w in raw_text for w in ["groupe", "filiale", "cac 40", "grand compte", "leader mondial"]):
+    elif any(w in raw_text for w in LARGE_GROUP_MARKERS):
         context["company_type"] = "grand groupe"
         context["tone"] = "formal"
     
@@ -1262,33 +1553,21 @@ def analyze_job_context(job_data: dict) -> dict:
         context["growth_stage"] = "French Tech"
     
     # Détecter la taille de l'équipe data
-    import re
-    team_match = re.search(r'équipe\s+(?:data\s+)?(?:de\s+)?(\d+)', raw_text)
+    team_match = TEAM_SIZE_RE.search(raw_text)
     if team_match:
         context["team_size"] = team_match.group(1)
     
     # Détecter le télétravail
-    if any(w in raw_text for w in ["full remote", "100% remote", "télétravail total"]):
+    if any(w in raw_text for w in FULL_REMOTE_MARKERS):
         context["remote_policy"] = "full remote"
-    elif any(w in raw_text for w in ["télétravail", "remote", "hybride"]):
+    elif any(w in raw_text for w in HYBRID_REMOTE_MARKERS):
         context["remote_policy"] = "hybride"
     
     # Extraire la stack technique mentionnée
-    tech_keywords = ["bigquery", "snowflake", "databricks", "airflow", "dbt", "spark", 
-                     "kafka", "python", "sql", "terraform", "docker", "kubernetes",
-                     "aws", "gcp", "azure", "looker", "tableau", "power bi", "dataflow"]
-    context["tech_stack"] = [t for t in tech_keywords if t in raw_text]
+    context["tech_stack"] = [t for t in CONTEXT_TECH_KEYWORDS if t in raw_text]
     
     # Extraire les valeurs de l'entreprise
-    value_keywords = {
-        "innovation": ["innovation", "innover", "disruption", "révolutionne"],
-        "collaboration": ["collaboration", "équipe", "ensemble", "collectif"],
-        "excellence": ["excellence", "exigence", "qualité", "rigueur"],
-        "impact": ["impact", "différence", "transformation", "changer"],
-        "croissance": ["croissance", "ambition", "scale", "développement"],
-        "bienveillance": ["bienveillance", "humain", "bien-être", "care"]
-    }
-    for value, keywords in value_keywords.items():
+    for value, keywords in VALUE_KEYWORDS.items():
         if any(k in raw_text for k in keywords):
             context["values"].append(value)
     
@@ -1305,6 +1584,101 @@ def analyze_job_context(job_data: dict) -> dict:
     return context
 
 
+# Traductions pour la lettre de motivation
+COVER_LETTER_TRANSLATIONS = {
+    'fr': {
+        'babel': 'french',
+        'subject': 'Objet :',
+        'application_for': 'Candidature au poste de',
+        'greeting': 'Madame, Monsieur,',
+        'today_intro': 'Aujourd\'hui, je souhaite mettre mes compétences au service de',
+        'as_position': 'en tant que',
+        'recruitment': 'Service Recrutement',
+        'made_at': 'Fait à',
+        'on_date': 'le',
+        'accroche_default': "Passionné par la data et son potentiel de transformation, je souhaite aujourd'hui mettre mes compétences au service de votre entreprise.",
+        'currently': 'Actuellement',
+        'at': 'chez',
+        'developed_expertise': "j'ai développé une expertise approfondie, notamment en",
+        'previous_exp': "Mon expérience précédente en tant que",
+        'allowed_develop': "m'a permis de développer une solide culture de la qualité des données et de la collaboration transverse",
+        'education_complement': "Ma formation en",
+        'at_school': "à",
+        'completes_path': "complète ce parcours par une vision analytique rigoureuse",
+        'joining_team': "Intégrer votre équipe en tant que",
+        'represents_opportunity': "représente pour moi l'opportunité de mettre mes compétences techniques",
+        'at_service': "au service de vos projets. Ma",
+        'will_be_assets': "seront des atouts pour contribuer efficacement à la réussite de vos missions.",
+        'formule_formal': "Dans l'attente de votre réponse, je me tiens à votre disposition pour un entretien. Je vous prie d'agréer, Madame, Monsieur, l'expression de mes salutations distinguées.",
+        'formule_casual': "Je serais ravi d'échanger avec vous lors d'un entretien pour vous présenter plus en détail mon parcours et mes motivations. Dans cette attente, je vous adresse mes meilleures salutations.",
+        'formule_default': "En espérant que ma candidature retiendra votre attention, je reste à votre disposition pour un entretien. Veuillez agréer, Madame, Monsieur, mes sincères salutations.",
+        'qualites_default': "rigueur, esprit d'équipe et proactivité",
+        'startup_intro': "En tant que startup innovante,",
+        'offers_environment': "offre un environnement propice à la prise d'initiative et à l'impact direct",
+        'scaleup_intro': ", en pleine phase de croissance, représente exactement le type d'environnement dynamique où je souhaite évoluer",
+        'mission_caught': "La mission de",
+        'caught_attention': "m'a particulièrement interpellé",
+        'appreciate': "J'apprécie particulièrement",
+        'values_of': "les valeurs d'",
+        'animating_team': "qui animent votre équipe",
+        'your_stack': "votre stack technique",
+        'ambitious_challenges': "les défis ambitieux que vous proposez",
+        'as_well_as': "ainsi que",
+        'and': "et",
+        'member_of': ", membre de la",
+        'embodies_ambition': ", incarne l'ambition et l'innovation qui me motivent",
+        'project_impact': "Cette réalisation illustre ma capacité à mener des projets data à fort impact.",
+        'convinced_value': ", je suis convaincu de pouvoir apporter une réelle valeur ajoutée à votre équipe.",
+        'strong_experience': "Fort de mon expérience en tant que",
+    },
+    'en': {
+        'babel': 'english',
+        'subject': 'Subject:',
+        'application_for': 'Application for the position of',
+        'greeting': 'Dear Hiring Manager,',
+        'today_intro': 'Today, I would like to bring my skills to',
+        'as_position': 'as a',
+        'recruitment': 'Recruitment Department',
+        'made_at': 'Written in',
+        'on_date': 'on',
+        'accroche_default': "Passionate about data and its transformative potential, I am eager to contribute my skills to your organization.",
+        'currently': 'Currently',
+        'at': 'at',
+        'developed_expertise': "I have developed deep expertise, particularly in",
+        'previous_exp': "My previous experience as",
+        'allowed_develop': "enabled me to build a strong foundation in data quality and cross-functional collaboration",
+        'education_complement': "My education in",
+        'at_school': "at",
+        'completes_path': "complements this path with a rigorous analytical perspective",
+        'joining_team': "Joining your team as a",
+        'represents_opportunity': "represents an opportunity for me to apply my technical skills",
+        'at_service': "to support your projects. My",
+        'will_be_assets': "will be valuable assets to contribute effectively to your mission's success.",
+        'formule_formal': "I look forward to your response and remain at your disposal for an interview. Please accept my best regards.",
+        'formule_casual': "I would be delighted to discuss my background and motivations with you in an interview. Looking forward to hearing from you. Best regards.",
+        'formule_default': "I hope my application will be of interest to you, and I remain available for an interview at your convenience. Sincerely.",
+        'qualites_default': "rigor, teamwork and proactivity",
+        'startup_intro': "As an innovative startup,",
+        'offers_environment': "offers an environment conducive to initiative and direct impact",
+        'scaleup_intro': ", in full growth phase, represents exactly the kind of dynamic environment where I want to evolve",
+        'mission_caught': "The mission of",
+        'caught_attention': "particularly caught my attention",
+        'appreciate': "I particularly appreciate",
+        'values_of': "the values of",
+        'animating_team': "that drive your team",
+        'your_stack': "your tech stack",
+        'ambitious_challenges': "the ambitious challenges you offer",
+        'as_well_as': "as well as",
+        'and': "and",
+        'member_of': ", member of the",
+        'embodies_ambition': ", embodies the ambition and innovation that motivate me",
+        'project_impact': "This achievement illustrates my ability to lead high-impact data projects.",
+        'convinced_value': ", I am confident I can bring real added value to your team.",
+        'strong_experience': "With my experience as",
+    }
+}
+
+
 def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None) -> None:
     """Génère la lettre de motivation LaTeX avec structure professionnelle
     
@@ -1325,106 +1699,25 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     phone = adapted["personal"]["phone"]
     personal_location = adapted["personal"]["location"]
     job_location = adapted.get("job_location", "") or personal_location
+    
+    # Versions échappées pour LaTeX, réutilisées dans tous les paragraphes
+    company_tex = escape_latex(company)
+    job_title_tex = escape_latex(job_title)
+    job_location_tex = escape_latex(job_location)
+    
     job_keywords = adapted.get("job_keywords", [])
     job_context = adapted.get("job_context", {})
     job_description = adapted.get("job_description", "")
     
+    # Formes normalisées des mots-clés et de la description, calculées une seule fois
+    job_keywords_set = {kw.lower() for kw in job_keywords}
+    long_job_keywords = tuple(kw for kw in job_keywords_set if len(kw) > 2)
+    job_description_lower = job_description.lower()
+    
     # Détection de la langue
     lang = adapted.get("language", "fr")
     
-    # Traductions pour la lettre de motivation
-    t = {
-        'fr': {
-            'babel': 'french',
-            'subject': 'Objet :',
-            'application_for': 'Candidature au poste de',
-            'greeting': 'Madame, Monsieur,',
-            'today_intro': 'Aujourd\'hui, je souhaite mettre mes compétences au service de',
-            'as_position': 'en tant que',
-            'recruitment': 'Service Recrutement',
-            'made_at': 'Fait à',
-            'on_date': 'le',
-            'accroche_default': "Passionné par la data et son potentiel de transformation, je souhaite aujourd'hui mettre mes compétences au service de votre entreprise.",
-            'currently': 'Actuellement',
-            'at': 'chez',
-            'developed_expertise': "j'ai développé une expertise approfondie, notamment en",
-            'previous_exp': "Mon expérience précédente en tant que",
-            'allowed_develop': "m'a permis de développer une solide culture de la qualité des données et de la collaboration transverse",
-            'education_complement': "Ma formation en",
-            'at_school': "à",
-            'completes_path': "complète ce parcours par une vision analytique rigoureuse",
-            'joining_team': "Intégrer votre équipe en tant que",
-            'represents_opportunity': "représente pour moi l'opportunité de mettre mes compétences techniques",
-            'at_service': "au service de vos projets. Ma",
-            'will_be_assets': "seront des atouts pour contribuer efficacement à la réussite de vos missions.",
-            'formule_formal': "Dans l'attente de votre réponse, je me tiens à votre disposition pour un entretien. Je vous prie d'agréer, Madame, Monsieur, l'expression de mes salutations distinguées.",
-            'formule_casual': "Je serais ravi d'échanger avec vous lors d'un entretien pour vous présenter plus en détail mon parcours et mes motivations. Dans cette attente, je vous adresse mes meilleures salutations.",
-            'formule_default': "En espérant que ma candidature retiendra votre attention, je reste à votre disposition pour un entretien. Veuillez agréer, Madame, Monsieur, mes sincères salutations.",
-            'qualites_default': "rigueur, esprit d'équipe et proactivité",
-            'startup_intro': "En tant que startup innovante,",
-            'offers_environment': "offre un environnement propice à la prise d'initiative et à l'impact direct",
-            'scaleup_intro': ", en pleine phase de croissance, représente exactement le type d'environnement dynamique où je souhaite évoluer",
-            'mission_caught': "La mission de",
-            'caught_attention': "m'a particulièrement interpellé",
-            'appreciate': "J'apprécie particulièrement",
-            'values_of': "les valeurs d'",
-            'animating_team': "qui animent votre équipe",
-            'your_stack': "votre stack technique",
-            'ambitious_challenges': "les défis ambitieux que vous proposez",
-            'as_well_as': "ainsi que",
-            'and': "et",
-            'member_of': ", membre de la",
-            'embodies_ambition': ", incarne l'ambition et l'innovation qui me motivent",
-            'project_impact': "Cette réalisation illustre ma capacité à mener des projets data à fort impact.",
-            'convinced_value': ", je suis convaincu de pouvoir apporter une réelle valeur ajoutée à votre équipe.",
-            'strong_experience': "Fort de mon expérience en tant que",
-        },
-        'en': {
-            'babel': 'english',
-            'subject': 'Subject:',
-            'application_for': 'Application for the position of',
-            'greeting': 'Dear Hiring Manager,',
-            'today_intro': 'Today, I would like to bring my skills to',
-            'as_position': 'as a',
-            'recruitment': 'Recruitment Department',
-            'made_at': 'Written in',
-            'on_date': 'on',
-            'accroche_default': "Passionate about data and its transformative potential, I am eager to contribute my skills to your organization.",
-            'currently': 'Currently',
-            'at': 'at',
-            'developed_expertise': "I have developed deep expertise, particularly in",
-            'previous_exp': "My previous experience as",
-            'allowed_develop': "enabled me to build a strong foundation in data quality and cross-functional collaboration",
-            'education_complement': "My education in",
-            'at_school': "at",
-            'completes_path': "complements this path with a rigorous analytical perspective",
-            'joining_team': "Joining your team as a",
-            'represents_opportunity': "represents an opportunity for me to apply my technical skills",
-            'at_service': "to support your projects. My",
-            'will_be_assets': "will be valuable assets to contribute effectively to your mission's success.",
-            'formule_formal': "I look forward to your response and remain at your disposal for an interview. Please accept my best regards.",
-            'formule_casual': "I would be delighted to discuss my background and motivations with you in an interview. Looking forward to hearing from you. Best regards.",
-            'formule_default': "I hope my application will be of interest to you, and I remain available for an interview at your convenience. Sincerely.",
-            'qualites_default': "rigor, teamwork and proactivity",
-            'startup_intro': "As an innovative startup,",
-            'offers_environment': "offers an environment conducive to initiative and direct impact",
-            'scaleup_intro': ", in full growth phase, represents exactly the kind of dynamic environment where I want to evolve",
-            'mission_caught': "The mission of",
-            'caught_attention': "particularly caught my attention",
-            'appreciate': "I particularly appreciate",
-            'values_of': "the values of",
-            'animating_team': "that drive your team",
-            'your_stack': "your tech stack",
-            'ambitious_challenges': "the ambitious challenges you offer",
-            'as_well_as': "as well as",
-            'and': "and",
-            'member_of': ", member of the",
-            'embodies_ambition': ", embodies the ambition and innovation that motivate me",
-            'project_impact': "This achievement illustrates my ability to lead high-impact data projects.",
-            'convinced_value': ", I am confident I can bring real added value to your team.",
-            'strong_experience': "With my experience as",
-        }
-    }[lang]
+    t = COVER_LETTER_TRANSLATIONS[lang]
     
     # ============================================
     # TENTATIVE GÉNÉRATION MISTRAL
@@ -1460,7 +1753,7 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     # Sélectionner l'accroche la plus pertinente selon les mots-clés
     best_accroche_score = -1
     for acc in accroches:
-        score = sum(1 for kw in acc.get("keywords", []) if kw in job_keywords)
+        score = len({kw.lower() for kw in acc.get("keywords", ())} & job_keywords_set)
         if score > best_accroche_score:
             best_accroche_score = score
             accroche = acc["text"]
@@ -1478,7 +1771,7 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
         best_proj = None
         best_proj_score = -1
         for proj in projets:
-            score = sum(1 for kw in proj.get("keywords", []) if kw in job_keywords)
+            score = len({kw.lower() for kw in proj.get("keywords", ())} & job_keywords_set)
             if score > best_proj_score:
                 best_proj_score = score
                 best_proj = proj
@@ -1492,13 +1785,13 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     
     # Construire un paragraphe fluide sur l'entreprise
     if growth_stage:
-        intro_entreprise = f"{escape_latex(company)}{t['member_of']}{growth_stage}{t['embodies_ambition']}"
+        intro_entreprise = f"{company_tex}{t['member_of']}{growth_stage}{t['embodies_ambition']}"
     elif company_type == "startup":
-        intro_entreprise = f"{t['startup_intro']} {escape_latex(company)} {t['offers_environment']}"
+        intro_entreprise = f"{t['startup_intro']} {company_tex} {t['offers_environment']}"
     elif company_type == "scale-up":
-        intro_entreprise = f"{escape_latex(company)}{t['scaleup_intro']}"
+        intro_entreprise = f"{company_tex}{t['scaleup_intro']}"
     else:
-        intro_entreprise = f"{t['mission_caught']} {escape_latex(company)} {t['caught_attention']}"
+        intro_entreprise = f"{t['mission_caught']} {company_tex} {t['caught_attention']}"
 
     # Valeurs et stack
     complements = []
@@ -1539,9 +1832,8 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
         # Reformuler le bullet pour l'intégrer proprement
         first_bullet = relevant_bullets[0] if relevant_bullets else ""
         # Enlever le point final si présent et mettre en minuscule
-        if first_bullet.endswith('.'):
-            first_bullet = first_bullet[:-1]
-        first_bullet = first_bullet[0].lower() + first_bullet[1:] if first_bullet else ""
+        first_bullet = first_bullet.removesuffix('.')
+        first_bullet = first_bullet[:1].lower() + first_bullet[1:]
         
         para_moi_parts.append(f"{t['currently']} \\textbf{{{escape_latex(main_exp['title'])}}} {t['at']} \\textbf{{{escape_latex(main_exp['company'])}}}, {t['developed_expertise']} {escape_latex(first_bullet)}")
 
@@ -1562,25 +1854,22 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     # ============================================
     # Compétences techniques qui matchent exactement les mots-clés de l'offre
     matching_skills = []
-    job_keywords_lower = [kw.lower() for kw in job_keywords]
     
-    # Parcourir les compétences adaptées (déjà triées par pertinence)
-    for skill in adapted["skills"]:
-        for item in skill.get("items", []):
-            item_lower = item.lower()
-            # Match exact avec un mot-clé de l'offre
-            if item_lower in job_keywords_lower:
-                matching_skills.append(item)
-            # Ou l'item est dans le texte de l'offre
-            elif item_lower in job_description.lower():
-                matching_skills.append(item)
-            # Ou un mot-clé est contenu dans l'item
-            elif any(kw in item_lower for kw in job_keywords_lower if len(kw) > 2):
-                matching_skills.append(item)
+    # Items des compétences adaptées (déjà triées par pertinence), mis en minuscules une seule fois
+    items_lower = [(item, item.lower()) for skill in adapted["skills"] for item in skill.get("items", ())]
+    for item, item_lower in items_lower:
+        # Match exact avec un mot-clé de l'offre
+        if item_lower in job_keywords_set:
+            matching_skills.append(item)
+        # Ou l'item est dans le texte de l'offre
+        elif item_lower in job_description_lower:
+            matching_skills.append(item)
+        # Ou un mot-clé est contenu dans l'item
+        elif any(kw in item_lower for kw in long_job_keywords):
+            matching_skills.append(item)
     
     # Dédupliquer tout en gardant l'ordre
-    seen = set()
-    matching_skills = [x for x in matching_skills if not (x in seen or seen.add(x))]
+    matching_skills = list(dict.fromkeys(matching_skills))
     
     if matching_skills:
         skills_text = ", ".join(escape_latex(s) for s in matching_skills[:4])
@@ -1597,7 +1886,7 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     else:
         qualites_text = t['qualites_default']
 
-    para_nous = f"""{t['joining_team']} {escape_latex(job_title)} {t['represents_opportunity']} (\\textbf{{{skills_text}}}) {t['at_service']}{qualites_text} {t['will_be_assets']}"""
+    para_nous = f"""{t['joining_team']} {job_title_tex} {t['represents_opportunity']} (\\textbf{{{skills_text}}}) {t['at_service']}{qualites_text} {t['will_be_assets']}"""
     
     # ============================================
     # 5. FORMULE DE POLITESSE
@@ -1632,8 +1921,9 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     # COULEURS DE L'ENTREPRISE
     # ============================================
     colors = adapted.get('colors', {})
-    primary_color = colors.get('primary', (30, 60, 114))
-    secondary_color = colors.get('secondary', (212, 175, 55))
+    # Tuples (hashables) : les couleurs rechargées depuis du JSON arrivent sous forme de listes
+    primary_color = tuple(colors.get('primary', (30, 60, 114)))
+    secondary_color = tuple(colors.get('secondary', (212, 175, 55)))
     primary_rgb = rgb_to_latex(primary_color)
     secondary_rgb = rgb_to_latex(secondary_color)
     
@@ -1642,22 +1932,20 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
     logo_path = ""
     if logo_url:
         try:
-            # Télécharger le logo
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-            }
-            response = requests.get(logo_url, headers=headers, timeout=10, allow_redirects=True)
-            response.raise_for_status()
-            
-            # Sauvegarder le logo dans le dossier de sortie
-            logo_ext = "png"
-            content_type = response.headers.get('Content-Type', '')
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                logo_ext = "jpg"
-            
-            logo_file = output_path.parent / f"logo.{logo_ext}"
-            with open(logo_file, "wb") as f:
-                f.write(response.content)
+            # Télécharger le logo en flux, directement dans le dossier de sortie
+            with get_http_session().get(logo_url, headers=IMAGE_HEADERS, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                
+                logo_ext = "png"
+                content_type = response.headers.get('Content-Type', '')
+                if 'jpeg' in content_type or 'jpg' in content_type:
+                    logo_ext = "jpg"
+                
+                # iter_content (et non response.raw) pour décompresser un éventuel Content-Encoding
+                logo_file = output_path.parent / f"logo.{logo_ext}"
+                with open(logo_file, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             logo_path = str(logo_file)
             print(f"🖼️  Logo téléchargé: {logo_file.name}")
         except Exception as e:
@@ -1721,15 +2009,15 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
 \\begin{{minipage}}[t]{{0.45\\textwidth}}
 \\raggedleft
 {logo_line}
-\\textbf{{{escape_latex(company)}}}\\\\
+\\textbf{{{company_tex}}}\\\\
 {t['recruitment']}\\\\
-\\textit{{{t['made_at']} {escape_latex(job_location)}, {t['on_date']} \\today}}
+\\textit{{{t['made_at']} {job_location_tex}, {t['on_date']} \\today}}
 \\end{{minipage}}
 
 \\vspace{{1.5cm}}
 
 % Objet
-\\noindent\\textcolor{{mainblue}}{{\\textbf{{{t['subject']}}}}} {t['application_for']} {escape_latex(job_title)}
+\\noindent\\textcolor{{mainblue}}{{\\textbf{{{t['subject']}}}}} {t['application_for']} {job_title_tex}
 
 \\vspace{{0.8cm}}
 
@@ -1739,7 +2027,7 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
 \\vspace{{0.5cm}}
 
 % ACCROCHE
-\\noindent {escape_latex(accroche)} {t['today_intro']} \\textbf{{{escape_latex(company)}}} {t['as_position']} \\textbf{{{escape_latex(job_title)}}}.
+\\noindent {escape_latex(accroche)} {t['today_intro']} \\textbf{{{company_tex}}} {t['as_position']} \\textbf{{{job_title_tex}}}.
 
 \\vspace{{0.4cm}}
 
@@ -1773,28 +2061,44 @@ def generate_cover_letter(adapted: dict, output_path: Path, profile: dict = None
 \\end{{document}}
 """
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(cover_content)
+    write_text_atomic(output_path, cover_content)
     
     print(f"✅ Lettre de motivation générée: {output_path}")
 
 
+# Compilateurs LaTeX disponibles, cherchés une seule fois dans le PATH
+TECTONIC_BIN = shutil.which("tectonic")
+PDFLATEX_BIN = shutil.which("pdflatex")
+
+
 def compile_latex(tex_path: Path) -> bool:
     """Compile un fichier LaTeX en PDF avec tectonic ou pdflatex"""
-    # Essayer d'abord tectonic, puis pdflatex
-    compilers = [
-        (["tectonic", "-o", str(tex_path.parent), str(tex_path)], "tectonic"),
-        (["pdflatex", "-interaction=nonstopmode", "-output-directory", str(tex_path.parent), str(tex_path)], "pdflatex")
-    ]
-    
-    for cmd, name in compilers:
+    pdflatex = [PDFLATEX_BIN, "-interaction=batchmode", "-halt-on-error", "-no-shell-escape",
+                "-output-directory", str(tex_path.parent)]
+    pdflatex_passes = [pdflatex + [str(tex_path)]]
+    # Les overlays tikz (remember picture) lisent leurs positions dans le .aux :
+    # une première passe en -draftmode les écrit sans produire le PDF
+    if "remember picture" in tex_path.read_text(encoding="utf-8"):
+        pdflatex_passes.insert(0, pdflatex + ["-draftmode", str(tex_path)])
+    
+    # Essayer d'abord tectonic (qui gère lui-même les passes), puis pdflatex, parmi ceux installés
+    compilers = []
+    if TECTONIC_BIN:
+        compilers.append(([[TECTONIC_BIN, "-o", str(tex_path.parent), str(tex_path)]], "tectonic"))
+    if PDFLATEX_BIN:
+        compilers.append((pdflatex_passes, "pdflatex"))
+    
+    for passes, name in compilers:
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            for cmd in passes:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
+                if result.returncode != 0:
+                    break
             if result.returncode == 0:
                 pdf_path = tex_path.with_suffix(".pdf")
                 print(f"📄 PDF compilé: {pdf_path}")
@@ -1803,8 +2107,13 @@ def compile_latex(tex_path: Path) -> bool:
                 # Si le compilateur existe mais échoue, afficher l'erreur
                 if "not found" not in result.stderr.lower():
                     print(f"⚠️  Erreur de compilation avec {name}: {tex_path.name}")
+                    # En batchmode, pdflatex n'écrit les erreurs que dans le .log
+                    output = result.stdout
+                    log_path = tex_path.with_suffix(".log")
+                    if name == "pdflatex" and log_path.exists():
+                        output = log_path.read_text(encoding="utf-8", errors="ignore")
                     # Afficher les dernières lignes d'erreur
-                    error_lines = [l for l in result.stdout.split('\n') if 'error' in l.lower() or '!' in l]
+                    error_lines = [l for l in output.split('\n') if 'error' in l.lower() or '!' in l]
                     if error_lines:
                         print(f"   {error_lines[0][:100]}")
                     continue
@@ -1818,19 +2127,25 @@ def compile_latex(tex_path: Path) -> bool:
     return False
 
 
+# Lettres accentuées courantes (français et langues européennes) et leur équivalent ASCII
+ACCENT_FOLD = str.maketrans(
+    "àáâãäåçèéêëìíîïñòóôõöùúûüýÿÀÁÂÃÄÅÇÈÉÊËÌÍÎÏÑÒÓÔÕÖÙÚÛÜÝ",
+    "aaaaaaceeeeiiiinooooouuuuyyAAAAAACEEEEIIIINOOOOOUUUUY"
+)
+
+
 def format_filename(name: str, company: str) -> tuple:
     """Génère les noms de fichiers professionnels pour CV et lettre de motivation
     
     Format: CV_Prenom_Nom_Entreprise.pdf / LM_Prenom_Nom_Entreprise.pdf
     """
-    import unicodedata
-    import re
-    
     def normalize(text: str) -> str:
-        # Supprimer les accents
-        text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+        # Supprimer les accents : table pour les cas courants, NFKD pour le reste
+        text = text.translate(ACCENT_FOLD)
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
         # Garder seulement les caractères alphanumériques et espaces
-        text = re.sub(r'[^\w\s]', '', text)
+        text = NON_WORD_RE.sub('', text)
         # Remplacer les espaces par des underscores
         text = text.replace(' ', '_')
         return text
@@ -1876,20 +2191,30 @@ def main():
     print(f"🏢 Entreprise: {job_data['company'] or 'Non détectée'}")
     print(f"🔑 Mots-clés détectés: {', '.join(job_data['keywords'][:10])}")
     
-    print(f"\n📂 Chargement du profil...")
-    profile = load_profile()
-    
-    # Traduire le profil en anglais si l'offre est en anglais
-    if job_data.get("language") == "en":
-        print("🌐 Traduction du profil en anglais...")
-        profile = translate_profile_to_english(profile)
+    # Les couleurs du logo (téléchargement + Pillow) et la traduction du profil (Mistral)
+    # sont indépendantes : on les lance en parallèle
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        colors_future = None
+        if "colors" not in job_data:
+            colors_future = pool.submit(extract_colors_from_logo, job_data.get("logo_url"))
+        
+        print(f"\n📂 Chargement du profil...")
+        profile = load_profile()
+        
+        # Traduire le profil en anglais si l'offre est en anglais
+        if job_data.get("language") == "en":
+            print("🌐 Traduction du profil en anglais...")
+            profile = translate_profile_to_english(profile)
+        
+        if colors_future:
+            job_data["colors"] = colors_future.result()
+            save_cached_offer(args.url, job_data)
     
     print(f"🔄 Adaptation du profil...")
     adapted = adapt_profile(profile, job_data)
     
     # Sauvegarder les données de l'offre
-    with open(output_dir / "job_data.json", "w", encoding="utf-8") as f:
-        json.dump(job_data, f, ensure_ascii=False, indent=2)
+    (output_dir / "job_data.json").write_bytes(orjson.dumps(job_data, default=str, option=orjson.OPT_INDENT_2))
     
     # Nommage professionnel des fichiers
     name = profile["personal"]["name"]
@@ -1897,25 +2222,29 @@ def main():
     cv_filename, cover_filename = format_filename(name, company)
     
     # Générer les documents
+    to_compile = []
     if not args.cover_only:
         cv_path = output_dir / f"{cv_filename}.tex"
         generate_cv(adapted, cv_path)
-        if not args.no_compile:
-            compile_latex(cv_path)
-            print(f"   📄 {cv_filename}.pdf")
+        to_compile.append((cv_path, cv_filename))
     
     if not args.cv_only:
         cover_path = output_dir / f"{cover_filename}.tex"
         generate_cover_letter(adapted, cover_path, profile=profile)
-        if not args.no_compile:
-            compile_latex(cover_path)
-            print(f"   📄 {cover_filename}.pdf")
+        to_compile.append((cover_path, cover_filename))
+    
+    # Les deux compilations LaTeX sont des processus indépendants : on les lance en parallèle
+    if not args.no_compile and to_compile:
+        with ThreadPoolExecutor(max_workers=len(to_compile)) as pool:
+            futures = [(pool.submit(compile_latex, tex_path), filename) for tex_path, filename in to_compile]
+            for future, filename in futures:
+                future.result()
+                print(f"   📄 {filename}.pdf")
     
     print(f"\n✨ Terminé! Fichiers dans: {output_dir}")
     
     # Ouvrir le dossier de sortie
     if not args.no_compile:
-        import subprocess
         try:
             subprocess.run(["xdg-open", str(output_dir)], check=False, capture_output=True)
         except:
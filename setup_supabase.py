@@ -69,22 +69,18 @@ print("-" * 50)
 
 print("\n📦 Création du bucket Storage...")
 try:
-    # Vérifier si le bucket existe déjà
-    buckets = supabase.storage.list_buckets()
-    bucket_names = [b.name for b in buckets]
-    
-    if "documents" in bucket_names:
+    # Créer directement le bucket : Supabase répond "already exists" (409) s'il existe déjà
+    result = supabase.storage.create_bucket(
+        "documents",
+        options={"public": True}
+    )
+    print("✅ Bucket 'documents' créé avec succès")
+except Exception as e:
+    if "already exists" in str(e).lower() or "duplicate" in str(e).lower():
         print("✅ Bucket 'documents' existe déjà")
     else:
-        # Créer le bucket
-        result = supabase.storage.create_bucket(
-            "documents",
-            options={"public": True}
-        )
-        print("✅ Bucket 'documents' créé avec succès")
-except Exception as e:
-    print(f"⚠️  Erreur création bucket: {e}")
-    print("   Tu peux le créer manuellement dans Storage > New Bucket")
+        print(f"⚠️  Erreur création bucket: {e}")
+        print("   Tu peux le créer manuellement dans Storage > New Bucket")
 
 print("\n🧪 Test de connexion aux tables...")
 try: